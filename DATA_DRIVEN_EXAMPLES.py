@@ -20,15 +20,28 @@ tests:
 """
 
 import pytest
-from utils.data_loader import load_test_data
+from utils.data_loader import load_test_data, parse_bool
+
+# Load each data file once at import time and reuse it across examples
+_LOGIN = load_test_data("test_data/login.yaml")
+_SEARCH = load_test_data("test_data/search.json")
+_USERS = load_test_data("test_data/users.csv")
+_USERS_TYPED = load_test_data(
+    "test_data/users.csv",
+    converters={"age": int, "is_admin": parse_bool}
+)
+_FILTERS = load_test_data("test_data/filters.yaml")
+_PRODUCTS_YAML = load_test_data("test_data/products.yaml")
+_SEARCHES = load_test_data("test_data/searches.json")
+_PRODUCTS = load_test_data("test_data/products.json")
 
 @pytest.mark.parametrize(
     "login_data",
-    load_test_data("test_data/login.yaml")
+    _LOGIN
 )
-def test_login_simple(driver, login_data):
+def test_login_simple(shared_driver, login_data):
     """Simplest data-driven test pattern."""
-    page = LoginPage(driver)
+    page = LoginPage(shared_driver)
     page.login(login_data["username"], login_data["password"])
     assert page.is_logged_in()
 
@@ -50,12 +63,12 @@ Test data: test_data/search.json
 
 @pytest.mark.parametrize(
     "search_params",
-    load_test_data("test_data/search.json"),
+    _SEARCH,
     ids=lambda s: s["query"]  # Use query as test ID
 )
-def test_search_with_ids(driver, search_params):
+def test_search_with_ids(shared_driver, search_params):
     """Data-driven test with readable test IDs."""
-    page = SearchPage(driver)
+    page = SearchPage(shared_driver)
     results = page.search(search_params["query"])
     
     assert len(results) >= search_params["min_results"], \
@@ -76,17 +89,17 @@ jane_smith,jane@example.com,30,false
 
 @pytest.mark.parametrize(
     "user",
-    load_test_data("test_data/users.csv")
+    _USERS_TYPED
 )
 def test_create_user_from_csv(driver, user):
-    """CSV data requires type conversion."""
+    """CSV columns are typed once by the loader via converters."""
     page = UserPage(driver)
     
-    # CSV values are strings - convert as needed
+    # age is already int and is_admin already bool
     username = user["username"]
     email = user["email"]
-    age = int(user["age"])  # CSV → int
-    is_admin = user["is_admin"] == "true"  # CSV → bool
+    age = user["age"]
+    is_admin = user["is_admin"]
     
     page.create_user(username, email, age, is_admin)
     assert page.user_exists(username)
@@ -111,7 +124,7 @@ tests:
 
 @pytest.mark.parametrize(
     "filter_config",
-    load_test_data("test_data/filters.yaml"),
+    _FILTERS,
     ids=lambda c: c["filter_name"]
 )
 def test_product_filters(driver, filter_config):
@@ -154,12 +167,12 @@ class TestDataDrivenFeatures(BaseTest):
     
     @pytest.mark.parametrize(
         "credentials",
-        load_test_data("test_data/login.yaml"),
+        _LOGIN,
         ids=lambda c: c["username"]
     )
-    def test_multi_user_login(self, driver, credentials):
+    def test_multi_user_login(self, shared_driver, credentials):
         """Parametrized test within BaseTest class."""
-        page = LoginPage(driver)
+        page = LoginPage(shared_driver)
         page.login(credentials["username"], credentials["password"])
         assert page.is_logged_in()
 
@@ -173,7 +186,7 @@ Use fixtures when you need setup/teardown per test case.
 Less common than direct parametrization, but useful for complex scenarios.
 """
 
-@pytest.fixture(params=load_test_data("test_data/users.csv"))
+@pytest.fixture(params=_USERS)
 def user_with_setup(request):
     """Fixture that parametrizes with CSV data and adds setup."""
     user = request.param
@@ -224,7 +237,7 @@ Combine multiple parametrizations for cross-product testing.
 )
 @pytest.mark.parametrize(
     "product",
-    load_test_data("test_data/products.yaml")
+    _PRODUCTS_YAML
 )
 def test_product_purchase_multiple_users(driver, username, product):
     """Run same test with multiple users and products."""
@@ -242,25 +255,34 @@ def test_product_purchase_multiple_users(driver, username, product):
 Data-driven tests automatically run on all browsers in browser matrix.
 If browser matrix has 3 browsers and data has 5 cases:
 Total test runs = 3 browsers × 5 data cases = 15 tests
+
+sampled_matrix() reduces this to max(3, 5) = 5 runs while every browser
+and every data case still runs at least once. Pass --full-matrix to
+run all 15.
 """
 
+from config.config_loader import get_config_loader
+from utils.matrix import sampled_matrix
+
+_BROWSER_SEARCHES = sampled_matrix(
+    _SEARCHES,
+    get_config_loader().get_browser_matrix()
+)
+
 @pytest.mark.parametrize(
-    "search_term",
-    load_test_data("test_data/searches.json"),
-    ids=lambda s: s["query"]
+    "browser_profile,search_term",
+    _BROWSER_SEARCHES,
+    ids=[f"{b['name']}-{s['query']}" for b, s in _BROWSER_SEARCHES]
 )
-def test_search_all_browsers_all_queries(driver, search_term):
+def test_search_all_browsers_all_queries(shared_driver, browser_profile, search_term):
     """
-    Runs automatically on:
+    Runs on a covering sample, e.g.:
     - chrome_127 + query1
-    - chrome_127 + query2
-    - chrome_latest + query1
     - chrome_latest + query2
-    - firefox_latest + query1
-    - firefox_latest + query2
+    - firefox_latest + query3
     etc.
     """
-    page = SearchPage(driver)
+    page = SearchPage(shared_driver)
     results = page.search(search_term["query"])
     assert len(results) > 0
 
@@ -277,29 +299,31 @@ from pages.login_page import LoginPage
 from pages.products_page import ProductPage
 from pages.checkout_page import CheckoutPage
 from core.base_test import BaseTest
+from utils.matrix import covering_pairs
+
+# Every user and every product appears at least once;
+# pass --exhaustive to run the full users × products cross-product
+_USER_PRODUCT_PAIRS = covering_pairs(_USERS, _PRODUCTS)
 
 class TestE2EPurchaseFlow(BaseTest):
     """End-to-end purchase test with multiple data sources."""
     
     @pytest.mark.parametrize(
-        "user_data",
-        load_test_data("test_data/users.csv"),
-        ids=lambda u: u["username"]
-    )
-    @pytest.mark.parametrize(
-        "product",
-        load_test_data("test_data/products.json"),
-        ids=lambda p: p["name"]
+        "user_data,product",
+        _USER_PRODUCT_PAIRS,
+        ids=[f"{u['username']}-{p['name']}" for u, p in _USER_PRODUCT_PAIRS]
     )
     def test_complete_purchase_flow(self, driver, user_data, product):
         """
         Test complete purchase flow for multiple users and products.
         
+        Users and products are paired so each one is covered at least once
+        (max(users, products) runs instead of users × products).
+        
         Generates tests like:
         - test_complete_purchase_flow[john_doe-laptop]
-        - test_complete_purchase_flow[john_doe-phone]
-        - test_complete_purchase_flow[jane_smith-laptop]
         - test_complete_purchase_flow[jane_smith-phone]
+        - test_complete_purchase_flow[bob_wilson-laptop]
         etc.
         """
         
@@ -347,16 +371,19 @@ PATTERNS:
    )
    def test_something(driver, data):
 
-3. With fixture (optional):
+3. Reuse one browser across independent data rows:
+   def test_something(shared_driver, data):
+   (keep 'driver' for flows that need a fresh browser per test)
+
+4. With fixture (optional):
    @pytest.fixture(params=load_test_data("file.yaml"))
    def data_fixture(request):
        return request.param
    
    def test_something(driver, data_fixture):
 
-4. CSV type conversion:
-   age = int(data["age"])  # CSV → int
-   active = data["active"] == "true"  # CSV → bool
+5. CSV type conversion (done once by the loader):
+   load_test_data("file.csv", converters={"age": int, "active": parse_bool})
 
 FILES:
 
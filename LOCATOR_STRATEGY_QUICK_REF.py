@@ -52,6 +52,7 @@ FALLBACK BEHAVIOR
 Try Locator 1 → FAIL → Log
 Try Locator 2 → FAIL → Log
 Try Locator 3 → SUCCESS → Return element
+(list order is priority order; the result is re-checked and reused until the page navigates)
 
 All fail → Screenshot + Exception
 
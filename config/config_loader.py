@@ -4,12 +4,60 @@ Provides centralized configuration management for the automation framework.
 Loads and manages YAML configuration files.
 """
 
+import functools
 import os
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple, Union
 import yaml
 from loguru import logger
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+# Project root and default config directory, resolved once at import time
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_CONFIG_DIR = _PROJECT_ROOT / "config"
+
+# Process-wide cache of parsed YAML files, keyed by (path, mtime_ns, size).
+# Shared across ConfigLoader instances so that a fresh loader does not
+# re-parse files that have not changed on disk.
+_PARSED: Dict[Tuple[str, int, int], Mapping] = {}
+
+# Sentinel marking a key that could not be resolved in ConfigLoader.get
+_MISSING = object()
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert parsed YAML into a read-only structure.
+    
+    Dicts become MappingProxyType views and lists become tuples, so cached
+    configuration can be shared between callers without defensive copies.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Recursively convert a frozen configuration value back to dicts and lists.
+    
+    Use when a mutable or JSON-serializable copy is needed.
+    """
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
 
 class ConfigLoader:
     """
@@ -17,6 +65,9 @@ class ConfigLoader:
     
     This class provides methods to load and access configuration values
     from YAML files with graceful error handling and default value support.
+    
+    Loaded configurations are read-only: mappings are MappingProxyType
+    views and sequences are tuples. Use thaw() for a mutable copy.
     """
     
     def __init__(self, config_dir: Optional[str] = None):
@@ -27,27 +78,40 @@ class ConfigLoader:
             config_dir: Path to the configuration directory. 
                        Defaults to 'config' folder in project root.
         """
+        # Resolved up front so per-file paths are absolute without extra syscalls
         if config_dir is None:
-            # Get project root (parent of config directory)
-            project_root = Path(__file__).parent.parent
-            self.config_dir = project_root / "config"
+            self.config_dir = _DEFAULT_CONFIG_DIR
         else:
-            self.config_dir = Path(config_dir)
+            self.config_dir = Path(config_dir).resolve()
         
         # Cache for loaded configurations
-        self._config_cache: Dict[str, Dict] = {}
+        self._config_cache: Dict[str, Mapping] = {}
+        
+        # Resolved values for get(), keyed by (config_name, key),
+        # and dot-notation keys pre-split into tuples
+        self._get_cache: Dict[Tuple[str, str], Any] = {}
+        self._split_cache: Dict[str, Tuple[str, ...]] = {}
+        
+        # (config_name, key) pairs already reported as missing by get()
+        self._missing_keys: set = set()
+        
+        # Browser profiles indexed by name and the resolved browser matrix,
+        # built from browsers.yaml when it is loaded
+        self._browser_index: Optional[Mapping] = None
+        self._browser_names: Tuple[str, ...] = ()
+        self._matrix_cache: Optional[Tuple[Mapping, ...]] = None
         
         logger.info(f"ConfigLoader initialized with config directory: {self.config_dir}")
     
-    def _load_yaml_file(self, filename: str) -> Dict[str, Any]:
+    def _load_yaml_file(self, filename: str) -> Mapping:
         """
-        Load a YAML file and return its contents as a dictionary.
+        Load a YAML file and return its contents as a read-only mapping.
         
         Args:
             filename: Name of the YAML file to load
             
         Returns:
-            Dictionary containing the YAML file contents
+            Read-only mapping containing the YAML file contents
             
         Raises:
             FileNotFoundError: If the configuration file doesn't exist
@@ -55,15 +119,26 @@ class ConfigLoader:
         """
         file_path = self.config_dir / filename
         
-        if not file_path.exists():
+        try:
+            # Open first (EAFP) and stat the open descriptor, so a cache hit
+            # costs one open + fstat and there is no exists()/open() race
+            with open(file_path, 'rb') as file:
+                stat = os.fstat(file.fileno())
+                cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+                if cache_key in _PARSED:
+                    return _PARSED[cache_key]
+                
+                # Read raw bytes and let the (libyaml) loader decode UTF-8 itself
+                raw = file.read()
+            
+            config_data = yaml.load(raw, Loader=_Loader)
+            logger.debug(f"Successfully loaded configuration from: {filename}")
+            config_data = freeze(config_data if config_data is not None else {})
+            _PARSED[cache_key] = config_data
+            return config_data
+        except FileNotFoundError:
             logger.error(f"Configuration file not found: {file_path}")
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                config_data = yaml.safe_load(file)
-                logger.debug(f"Successfully loaded configuration from: {filename}")
-                return config_data if config_data is not None else {}
         except yaml.YAMLError as e:
             logger.error(f"Error parsing YAML file {filename}: {e}")
             raise
@@ -71,7 +146,7 @@ class ConfigLoader:
             logger.error(f"Unexpected error loading {filename}: {e}")
             raise
     
-    def load_config(self, config_name: str = "config") -> Dict[str, Any]:
+    def load_config(self, config_name: str = "config") -> Mapping:
         """
         Load a configuration file by name.
         
@@ -80,12 +155,12 @@ class ConfigLoader:
                         (e.g., 'config', 'browsers', 'reporting')
             
         Returns:
-            Dictionary containing the configuration data
+            Read-only mapping containing the configuration data
         """
-        # Check cache first
-        if config_name in self._config_cache:
-            logger.debug(f"Returning cached configuration: {config_name}")
-            return self._config_cache[config_name]
+        # Check cache first (steady-state fast path, intentionally not logged)
+        config_data = self._config_cache.get(config_name)
+        if config_data is not None:
+            return config_data
         
         # Load from file
         filename = f"{config_name}.yaml"
@@ -93,10 +168,28 @@ class ConfigLoader:
         
         # Cache the loaded configuration
         self._config_cache[config_name] = config_data
+        if config_name == "browsers":
+            self._index_browser_profiles(config_data)
         logger.info(f"Configuration '{config_name}' loaded and cached")
         
         return config_data
     
+    def _index_browser_profiles(self, browsers_config: Mapping) -> None:
+        """
+        Index legacy browser profiles by name for O(1) lookup.
+        
+        Args:
+            browsers_config: The loaded browsers configuration
+        """
+        profiles = browsers_config.get("browsers")
+        if isinstance(profiles, Mapping):
+            self._browser_index = profiles
+            self._browser_names = tuple(profiles)
+        else:
+            self._browser_index = None
+            self._browser_names = ()
+        self._matrix_cache = None
+    
     def get(self, key: str, config_name: str = "config", 
             default: Any = None) -> Any:
         """
@@ -117,32 +210,36 @@ class ConfigLoader:
             >>> base_url = config_loader.get('base_url', default='http://localhost')
             >>> browser = config_loader.get('browsers.chrome_127', 'browsers')
         """
+        cache_key = (config_name, key)
+        value = self._get_cache.get(cache_key, _MISSING)
+        if value is not _MISSING:
+            return value
+        
         try:
             config_data = self.load_config(config_name)
             
-            # Handle nested keys using dot notation
-            if '.' in key:
-                keys = key.split('.')
-                value = config_data
-                for k in keys:
-                    if isinstance(value, dict) and k in value:
-                        value = value[k]
-                    else:
+            # Handle nested keys using dot notation (split once per key)
+            keys = self._split_cache.get(key)
+            if keys is None:
+                keys = tuple(key.split('.'))
+                self._split_cache[key] = keys
+            
+            value = config_data
+            for k in keys:
+                if isinstance(value, Mapping) and k in value:
+                    value = value[k]
+                else:
+                    # Warn once per key; repeated misses stay silent
+                    if cache_key not in self._missing_keys:
+                        self._missing_keys.add(cache_key)
                         logger.warning(
                             f"Key '{key}' not found in {config_name}.yaml, "
                             f"returning default: {default}"
                         )
-                        return default
-                return value
-            else:
-                # Simple key lookup
-                value = config_data.get(key, default)
-                if value == default and key not in config_data:
-                    logger.warning(
-                        f"Key '{key}' not found in {config_name}.yaml, "
-                        f"returning default: {default}"
-                    )
-                return value
+                    return default
+            
+            self._get_cache[cache_key] = value
+            return value
                 
         except Exception as e:
             logger.error(
@@ -151,7 +248,7 @@ class ConfigLoader:
             )
             return default
     
-    def get_all(self, config_name: str = "config") -> Dict[str, Any]:
+    def get_all(self, config_name: str = "config") -> Mapping:
         """
         Get all configuration values from a config file.
         
@@ -159,11 +256,11 @@ class ConfigLoader:
             config_name: Name of the configuration file
             
         Returns:
-            Complete configuration dictionary
+            Complete read-only configuration mapping
         """
         return self.load_config(config_name)
     
-    def reload_config(self, config_name: str) -> Dict[str, Any]:
+    def reload_config(self, config_name: str) -> Mapping:
         """
         Force reload a configuration file, bypassing the cache.
         
@@ -171,20 +268,35 @@ class ConfigLoader:
             config_name: Name of the configuration to reload
             
         Returns:
-            Reloaded configuration dictionary
+            Reloaded read-only configuration mapping
         """
         if config_name in self._config_cache:
             logger.info(f"Clearing cache for configuration: {config_name}")
             del self._config_cache[config_name]
         
+        # Drop resolved values that came from the old file contents
+        for cache_key in [ck for ck in self._get_cache if ck[0] == config_name]:
+            del self._get_cache[cache_key]
+        self._missing_keys = {ck for ck in self._missing_keys if ck[0] != config_name}
+        if config_name == "browsers":
+            self._browser_index = None
+            self._browser_names = ()
+            self._matrix_cache = None
+        
         return self.load_config(config_name)
     
     def clear_cache(self) -> None:
         """Clear all cached configurations."""
         self._config_cache.clear()
+        self._get_cache.clear()
+        self._split_cache.clear()
+        self._missing_keys.clear()
+        self._browser_index = None
+        self._browser_names = ()
+        self._matrix_cache = None
         logger.info("Configuration cache cleared")
     
-    def get_browser_config(self, browser_name: str) -> Dict[str, Any]:
+    def get_browser_config(self, browser_name: str) -> Mapping:
         """
         Get configuration for a specific browser profile.
         
@@ -192,21 +304,22 @@ class ConfigLoader:
             browser_name: Name of the browser profile (e.g., 'chrome_127')
             
         Returns:
-            Browser configuration dictionary
+            Read-only browser configuration mapping
             
         Raises:
             ValueError: If browser profile is not found
         """
-        browsers = self.load_config("browsers")
+        if self._browser_index is None:
+            self.load_config("browsers")
         
-        if "browsers" not in browsers:
+        if self._browser_index is None:
             logger.error("'browsers' key not found in browsers.yaml")
             raise ValueError("Invalid browsers configuration structure")
         
-        browser_profiles = browsers["browsers"]
+        profile = self._browser_index.get(browser_name)
         
-        if browser_name not in browser_profiles:
-            available = ", ".join(browser_profiles.keys())
+        if profile is None:
+            available = ", ".join(self._browser_names)
             logger.error(
                 f"Browser profile '{browser_name}' not found. "
                 f"Available profiles: {available}"
@@ -217,7 +330,7 @@ class ConfigLoader:
             )
         
         logger.debug(f"Retrieved browser configuration for: {browser_name}")
-        return browser_profiles[browser_name]
+        return profile
     
     def get_default_browser(self) -> str:
         """
@@ -228,12 +341,12 @@ class ConfigLoader:
         """
         return self.get("default_browser", "browsers", default="chrome_127")
     
-    def get_browser_matrix(self) -> list[Dict[str, Any]]:
+    def get_browser_matrix(self) -> Tuple[Mapping, ...]:
         """
         Get the browser matrix configuration.
         
         Returns:
-            List of browser profile dictionaries from the matrix section
+            Tuple of read-only browser profile mappings from the matrix section
             
         Raises:
             ValueError: If matrix is not properly configured
@@ -241,6 +354,9 @@ class ConfigLoader:
         try:
             browsers_config = self.load_config("browsers")
             
+            if self._matrix_cache is not None:
+                return self._matrix_cache
+            
             # Check if matrix section exists
             if "matrix" not in browsers_config:
                 logger.warning(
@@ -248,22 +364,24 @@ class ConfigLoader:
                     "Falling back to legacy browsers section."
                 )
                 # Fallback: return list of legacy browser profiles
-                return self._get_legacy_browser_matrix(browsers_config)
+                self._matrix_cache = self._get_legacy_browser_matrix(browsers_config)
+                return self._matrix_cache
             
             matrix = browsers_config["matrix"]
             
-            if not isinstance(matrix, list) or len(matrix) == 0:
+            if not isinstance(matrix, tuple) or len(matrix) == 0:
                 logger.error("Browser matrix must be a non-empty list")
                 raise ValueError("Browser matrix must be a non-empty list")
             
             logger.info(f"Loaded browser matrix with {len(matrix)} profiles")
+            self._matrix_cache = matrix
             return matrix
         
         except Exception as e:
             logger.error(f"Failed to load browser matrix: {e}")
             raise
     
-    def _get_legacy_browser_matrix(self, browsers_config: Dict[str, Any]) -> list[Dict[str, Any]]:
+    def _get_legacy_browser_matrix(self, browsers_config: Mapping) -> Tuple[Mapping, ...]:
         """
         Convert legacy browsers section to matrix format for backward compatibility.
         
@@ -271,7 +389,7 @@ class ConfigLoader:
             browsers_config: The loaded browsers configuration
             
         Returns:
-            List of browser profiles in matrix format
+            Tuple of read-only browser profiles in matrix format
             
         Raises:
             ValueError: If browsers section is not properly configured
@@ -284,16 +402,15 @@ class ConfigLoader:
             raise ValueError("Invalid browsers configuration: missing both 'matrix' and 'browsers'")
         
         browser_profiles = browsers_config["browsers"]
-        if not isinstance(browser_profiles, dict) or len(browser_profiles) == 0:
+        if not isinstance(browser_profiles, Mapping) or len(browser_profiles) == 0:
             logger.error("Legacy 'browsers' section must be a non-empty dictionary")
             raise ValueError("Invalid legacy browsers configuration")
         
         # Convert dict of profiles to list format for backward compatibility
-        matrix = []
-        for profile_name, profile_config in browser_profiles.items():
-            profile_entry = {"name": profile_name}
-            profile_entry.update(profile_config)
-            matrix.append(profile_entry)
+        matrix = tuple(
+            MappingProxyType({"name": profile_name, **profile_config})
+            for profile_name, profile_config in browser_profiles.items()
+        )
         
         logger.info(
             f"Converted {len(matrix)} legacy browser profiles to matrix format"
@@ -301,18 +418,14 @@ class ConfigLoader:
         return matrix
 
 
-# Singleton instance for global access
-_config_loader_instance: Optional[ConfigLoader] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_config_loader() -> ConfigLoader:
     """
     Get or create the singleton ConfigLoader instance.
     
+    Call get_config_loader.cache_clear() to force a fresh instance.
+    
     Returns:
         ConfigLoader instance
     """
-    global _config_loader_instance
-    if _config_loader_instance is None:
-        _config_loader_instance = ConfigLoader()
-    return _config_loader_instance
+    return ConfigLoader()
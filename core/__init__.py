@@ -3,7 +3,14 @@ Core package for the automation framework.
 Contains driver management and base test classes.
 """
 
-from core.driver_factory import DriverFactory
 from core.base_test import BaseTest
 
 __all__ = ['DriverFactory', 'BaseTest']
+
+
+def __getattr__(name):
+    # DriverFactory pulls in Playwright; import it only when first used
+    if name == 'DriverFactory':
+        from core.driver_factory import DriverFactory
+        return DriverFactory
+    raise AttributeError(f"module 'core' has no attribute {name!r}")
@@ -4,12 +4,12 @@ Base page class with integrated LocatorUtility support.
 All page objects should inherit from BasePage.
 """
 
-from typing import List, Dict, Optional
-from playwright.sync_api import Page
+from typing import Any, List, Dict, Optional
+from playwright.sync_api import Page, Locator
 from loguru import logger
 
 from core.locator_strategy import LocatorUtility
-from config.config_loader import ConfigLoader
+from config.config_loader import get_config_loader
 
 
 class BasePage:
@@ -29,7 +29,7 @@ class BasePage:
             page: Playwright Page object from driver fixture
         """
         self.page = page
-        self.config_loader = ConfigLoader()
+        self.config_loader = get_config_loader()
         
         # Get timeout from config (in seconds), convert to milliseconds
         timeout_seconds = self.config_loader.get('element_timeout', default=5)
@@ -38,19 +38,115 @@ class BasePage:
         # Initialize locator utility
         self.locator_util = LocatorUtility(page=self.page, timeout=self.timeout)
         
+        # JSON payload fetched by navigate_to(api_shortcut=...)
+        self._api_cache: Optional[Any] = None
+        
         logger.debug(f"BasePage initialized with timeout: {timeout_seconds}s")
     
-    def navigate_to(self, url: str) -> None:
+    def navigate_to(self, url: str, api_shortcut: Optional[Dict[str, str]] = None) -> None:
         """
         Navigate to URL.
         
+        When api_shortcut is given, the page is not rendered: its JSON
+        endpoint is fetched through the page's APIRequestContext (sharing
+        the context's cookies) and the result is available via
+        get_api_data(). Use it for checks that only need the data behind
+        a page, not its DOM.
+        
         Args:
             url: URL to navigate to
+            api_shortcut: Optional dict with 'endpoint' - JSON URL serving
+                          the same data as the page
+            
+        Raises:
+            Exception: If the API endpoint does not return a success status
+            
+        Usage:
+            self.navigate_to(
+                product_url,
+                api_shortcut={'endpoint': f"{base_url}/api/product/{product_id}"}
+            )
+            price = self.get_api_data()['price']
         """
+        # Resolved Locators re-query the DOM on every action, so they stay
+        # valid while a page changes; forget them so each page re-checks
+        self.locator_util.clear_cache()
+        self._api_cache = None
+        
+        if api_shortcut:
+            endpoint = api_shortcut['endpoint']
+            logger.info(f"Fetching via API instead of navigating to {url}: {endpoint}")
+            response = self.page.request.get(endpoint)
+            if not response.ok:
+                error_msg = f"API shortcut failed for {url}: {endpoint} returned {response.status}"
+                logger.error(error_msg)
+                raise Exception(error_msg)
+            self._api_cache = response.json()
+            logger.debug(f"API shortcut completed: {endpoint}")
+            return
+        
         logger.info(f"Navigating to: {url}")
-        self.page.goto(url)
+        # Actions auto-wait for their elements, so don't wait for subresources
+        self.page.goto(url, wait_until='domcontentloaded')
         logger.debug(f"Navigation completed: {url}")
     
+    def get_api_data(self) -> Optional[Any]:
+        """
+        Get the JSON payload fetched by the last navigate_to(api_shortcut=...).
+        
+        Returns:
+            Parsed JSON, or None if the last navigation rendered the page
+        """
+        return self._api_cache
+    
+    def prefetch_elements(self, elements: Dict[str, List[Dict[str, str]]]) -> None:
+        """
+        Resolve several elements that are already on screen in one round-trip.
+        
+        Elements found visible are cached, so later actions using the same
+        locator list skip their own visibility wait; the rest
+        are resolved as usual when first used.
+        
+        Args:
+            elements: Locator lists keyed by element name (used for logging)
+            
+        Usage:
+            self.prefetch_elements({
+                "Password Input": self.LOGIN_PASSWORD_INPUT,
+                "Login Submit Button": self.LOGIN_SUBMIT_BUTTON,
+            })
+        """
+        found = self.locator_util.ensure_visible_batch(elements)
+        logger.debug(
+            "Prefetched {}/{} element(s)",
+            sum(locator is not None for locator in found.values()), len(found)
+        )
+    
+    def _resolve(
+        self,
+        locators: List[Dict[str, str]],
+        element_name: str
+    ) -> Locator:
+        """
+        Return the Locator for an element, resolving it once per page.
+        
+        Locators are tried in list order through LocatorUtility.find_element(),
+        so a broad fallback entry never wins over a more specific one that
+        matches; its cache is cleared on navigate_to().
+        
+        Args:
+            locators: List of locator dictionaries
+            element_name: Name of element for logging
+            
+        Returns:
+            Cached or newly resolved Playwright Locator
+            
+        Raises:
+            ValueError: If no locators are provided
+            Exception: If no locator matches a visible element within timeout
+        """
+        return self.locator_util.find_element(locators, element_name)
+    
     def click(
         self,
         locators: List[Dict[str, str]],
@@ -70,7 +166,8 @@ class BasePage:
                 "Submit Button"
             )
         """
-        self.locator_util.click_element(locators, element_name)
+        self._resolve(locators, element_name).click()
+        logger.info(f"{element_name}: ✓ Clicked successfully")
     
     def type(
         self,
@@ -86,7 +183,8 @@ class BasePage:
             locators: List of locator dictionaries
             text: Text to type
             element_name: Name of element for logging
-            clear_first: Whether to clear field before typing
+            clear_first: Kept for compatibility; fill() always replaces the
+                         field's value, so no separate clear is issued
             
         Usage:
             self.type(
@@ -95,7 +193,10 @@ class BasePage:
                 "Email Field"
             )
         """
-        self.locator_util.type_text(locators, text, element_name, clear_first)
+        # fill() replaces the current value in one call; a preceding clear()
+        # would only add a round-trip
+        self._resolve(locators, element_name).fill(text)
+        logger.info(f"{element_name}: ✓ Text entered successfully")
 
     def select(
         self,
@@ -121,7 +222,7 @@ class BasePage:
                 element_name="Country Dropdown"
             )
         """
-        element = self.locator_util.find_element(locators, element_name)
+        element = self._resolve(locators, element_name)
         try:
             # Try by value first
             element.select_option(value=value)
@@ -153,7 +254,7 @@ class BasePage:
                 "Success Message"
             )
         """
-        return self.locator_util.get_text(locators, element_name)
+        return self._resolve(locators, element_name).inner_text()
     
     def is_visible(
         self,
@@ -170,7 +271,10 @@ class BasePage:
         Returns:
             True if element is visible, False otherwise
         """
-        return self.locator_util.is_visible(locators, element_name)
+        try:
+            return self._resolve(locators, element_name).is_visible()
+        except Exception:
+            return False
     
     def find_element(
         self,
@@ -188,7 +292,7 @@ class BasePage:
         Returns:
             Playwright Locator object
         """
-        return self.locator_util.find_element(locators, element_name)
+        return self._resolve(locators, element_name)
     
     def get_title(self) -> str:
         """Get page title."""
@@ -198,13 +302,25 @@ class BasePage:
         """Get current page URL."""
         return self.page.url
     
-    def wait_for_page_load(self, timeout: Optional[int] = None) -> None:
+    def wait_for_page_load(
+        self,
+        timeout: Optional[int] = None,
+        state: str = 'domcontentloaded'
+    ) -> None:
         """
-        Wait for page to load completely.
+        Wait for the page to reach a load state.
+        
+        Defaults to 'domcontentloaded': element actions auto-wait for
+        actionability, so waiting for every image and tracker ('load') only
+        adds time. Pass state='load' when a check needs all subresources.
         
         Args:
             timeout: Timeout in milliseconds (None = use default)
+            state: Load state to wait for ('domcontentloaded', 'load', 'networkidle')
         """
         timeout_ms = timeout or self.timeout
-        self.page.wait_for_load_state('load', timeout=timeout_ms)
+        self.page.wait_for_load_state(state, timeout=timeout_ms)
+        # Usually called after a click navigated: elements resolved on the
+        # previous page must be looked up again
+        self.locator_util.clear_cache()
         logger.debug("Page load completed")
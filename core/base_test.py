@@ -5,7 +5,7 @@ Base test class for all automation tests.
 Tests inherit from BaseTest to get access to fixture support.
 """
 
-from config.config_loader import ConfigLoader
+from config.config_loader import ConfigLoader, get_config_loader
 
 
 class BaseTest:
@@ -37,8 +37,6 @@ class BaseTest:
     
     @property
     def config_loader(self) -> ConfigLoader:
-        """Lazy-load ConfigLoader instance for test methods."""
-        if not hasattr(self, '_config_loader'):
-            self._config_loader = ConfigLoader()
-        return self._config_loader
+        """Shared ConfigLoader instance for test methods."""
+        return get_config_loader()
 
@@ -6,26 +6,38 @@ All fixtures and hooks for the automation framework.
 """
 
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Callable, Generator, Optional, Dict, Any, List, Tuple
 
 import pytest
-from playwright.sync_api import Page
 from loguru import logger
 
-from core.driver_factory import DriverFactory
-from config.config_loader import ConfigLoader
-from reporting.manager import ReportingManager
+from config.config_loader import ConfigLoader, get_config_loader
+from utils import matrix
+
+# Playwright (and DriverFactory, which imports it) is only needed once a
+# browser fixture runs; keep it out of collection-time imports
+if TYPE_CHECKING:
+    from playwright.sync_api import Page, Playwright
+    from core.driver_factory import DriverFactory
 
 
 _REPORTS_RUN_DIR = None
-_BROWSER_MATRIX = None
+_SCREENSHOTS_DIR = None
+# loguru handler added by pytest_configure (replaced, not duplicated, on re-configure)
+_LOG_HANDLER_ID = None
+_BROWSER_MATRIX = None  # (profiles, ids) after applying --browser
+_RUN_DIR_ENV = "AUTOMATION_REPORTS_RUN_DIR"
+_SAFE_NAME_RE = re.compile(r'[^A-Za-z0-9_\-]')
 
 
 def pytest_configure(config):
-    """Register markers and create timestamped reports directory."""
-    global _REPORTS_RUN_DIR
+    """Register markers and create timestamped reports and output directories."""
+    global _REPORTS_RUN_DIR, _SCREENSHOTS_DIR, _LOG_HANDLER_ID
     
     config.addinivalue_line(
         "markers", 
@@ -36,115 +48,234 @@ def pytest_configure(config):
         "remote: run test on remote Selenium Grid/Moon"
     )
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    reports_base = Path(__file__).parent.parent / "reports"
-    _REPORTS_RUN_DIR = reports_base / f"{timestamp}"
+    # The controller picks the timestamped run directory and exports it, so
+    # pytest-xdist workers (started after pytest_configure) share it
+    run_dir = os.environ.get(_RUN_DIR_ENV)
+    if run_dir is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        run_dir = str(Path(__file__).parent.parent / "reports" / f"{timestamp}")
+        os.environ[_RUN_DIR_ENV] = run_dir
+    run_root = Path(run_dir)
+    
+    # Per-worker artifacts (e.g. screenshots) go to a worker subdirectory
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    _REPORTS_RUN_DIR = run_root / worker if worker else run_root
     _REPORTS_RUN_DIR.mkdir(parents=True, exist_ok=True)
     
-    allure_dir = _REPORTS_RUN_DIR / "allure-results"
+    # Allure results from all workers are merged into one report
+    allure_dir = run_root / "allure-results"
     allure_dir.mkdir(parents=True, exist_ok=True)
     
     config.option.allure_report_dir = str(allure_dir)
     
-    # Initialize ReportingManager
+    # Read by the Playwright driver process (started later by
+    # _playwright_session): don't wait for web fonts before screenshots
+    os.environ.setdefault("PW_TEST_SCREENSHOT_NO_FONTS_READY", "1")
+    
+    # Must be set before test modules are imported (parametrize decorators)
+    matrix.EXHAUSTIVE = config.getoption("exhaustive", default=False)
+    
+    # Configure logging and initialize ReportingManager
+    from reporting.manager import ReportingManager
+    
     try:
-        config_loader = ConfigLoader()
+        config_loader = get_config_loader()
         configuration = config_loader.load_config("config")
+        
+        # Per-test records are logged at DEBUG; only show them when asked to.
+        # enqueue hands formatting and writing to loguru's worker thread
+        log_level = "DEBUG" if configuration.get("verbose_logging") else configuration.get("log_level", "INFO")
+        # Only replace loguru's default stderr handler (id 0) and our own
+        # handler; sinks added by plugins or users are left alone
+        try:
+            logger.remove(0 if _LOG_HANDLER_ID is None else _LOG_HANDLER_ID)
+        except ValueError:
+            pass
+        _LOG_HANDLER_ID = logger.add(sys.stderr, level=log_level, enqueue=True)
+        
         reporter_type = configuration.get("reporter", "allure")
         ReportingManager.init(reporter_type)
     except Exception as e:
         logger.warning(f"Failed to initialize ReportingManager: {e}. Falling back to Allure.")
         ReportingManager.init("allure")
     
+    # Create the remaining output directories once; failure paths reuse
+    # the cached Path instead of re-checking the filesystem
+    config_loader = get_config_loader()
+    Path("logs").mkdir(parents=True, exist_ok=True)
+    if config_loader.get("screenshot_on_failure", default=True):
+        # Inside the per-worker run directory, so xdist workers and
+        # consecutive runs never overwrite each other's screenshots
+        _SCREENSHOTS_DIR = _REPORTS_RUN_DIR / "screenshots"
+        _SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    
     logger.info(f"Reports directory: {_REPORTS_RUN_DIR}")
 
 
-def pytest_generate_tests(metafunc):
+def _resolve_browser_matrix(config) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
-    Dynamically parametrize tests with browser matrix at collection time.
+    Resolve the browser profiles and test ids to parametrize with.
     
-    This hook is called during test collection and allows us to:
-    - Load the browser matrix from browsers.yaml
-    - Parametrize any test that uses the 'browser_profile' fixture
-    - Generate test variations like: test_login[chrome_127], test_login[firefox_latest]
+    The matrix and the --browser filter are the same for every test, so
+    they are resolved on the first call and reused for the rest of
+    collection.
     
-    The parametrization happens at collection time (before test execution),
-    enabling proper parallel execution with pytest-xdist.
+    Args:
+        config: Pytest config (for the --browser option)
+        
+    Returns:
+        Tuple of (browser profiles, parameter ids)
+        
+    Raises:
+        ValueError: If --browser names a profile that is not in the matrix
     """
     global _BROWSER_MATRIX
     
-    # Only parametrize if the test function uses the 'browser_profile' fixture
-    if 'browser_profile' not in metafunc.fixturenames:
-        return
+    if _BROWSER_MATRIX is not None:
+        return _BROWSER_MATRIX
     
-    # Load browser matrix once and cache it
-    if _BROWSER_MATRIX is None:
-        try:
-            config_loader = ConfigLoader()
-            _BROWSER_MATRIX = config_loader.get_browser_matrix()
-            logger.info(
-                f"Loaded browser matrix with {len(_BROWSER_MATRIX)} profiles: "
-                f"{[p.get('name', 'unknown') for p in _BROWSER_MATRIX]}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to load browser matrix: {e}")
-            raise
+    try:
+        full_matrix = get_config_loader().get_browser_matrix()
+        logger.info(
+            f"Loaded browser matrix with {len(full_matrix)} profiles: "
+            f"{[p.get('name', 'unknown') for p in full_matrix]}"
+        )
+    except Exception as e:
+        logger.error(f"Failed to load browser matrix: {e}")
+        raise
     
     # Check for CLI override
-    browser_override = metafunc.config.getoption("--browser", default=None)
+    browser_override = config.getoption("--browser", default=None)
     
     if browser_override:
         # Filter matrix to only the specified browser
-        filtered_matrix = [
-            p for p in _BROWSER_MATRIX
+        matrix_to_use = [
+            p for p in full_matrix
             if p.get('name') == browser_override
         ]
         
-        if not filtered_matrix:
-            available = ", ".join(p.get('name', 'unknown') for p in _BROWSER_MATRIX)
+        if not matrix_to_use:
+            available = ", ".join(p.get('name', 'unknown') for p in full_matrix)
             raise ValueError(
                 f"Browser '{browser_override}' not found in matrix. "
                 f"Available: {available}"
             )
         
-        matrix_to_use = filtered_matrix
         logger.info(f"Using CLI override: --browser={browser_override}")
     else:
-        matrix_to_use = _BROWSER_MATRIX
+        matrix_to_use = list(full_matrix)
     
-    # Parametrize the test with each browser profile in the matrix
     # The parameter IDs will be the browser profile names (e.g., 'chrome_127', 'firefox_latest')
     profile_ids = [p.get('name', f"profile_{i}") for i, p in enumerate(matrix_to_use)]
     
+    _BROWSER_MATRIX = (matrix_to_use, profile_ids)
+    return _BROWSER_MATRIX
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Dynamically parametrize tests with browser matrix at collection time.
+    
+    This hook is called during test collection and allows us to:
+    - Load the browser matrix from browsers.yaml
+    - Parametrize any test that uses the 'browser_profile' fixture
+    - Generate test variations like: test_login[chrome_127], test_login[firefox_latest]
+    
+    The parametrization happens at collection time (before test execution),
+    enabling proper parallel execution with pytest-xdist.
+    """
+    # Only parametrize if the test function uses the 'browser_profile' fixture
+    if 'browser_profile' not in metafunc.fixturenames:
+        return
+    
+    # --browser-loop: one node per test; iterate profiles via for_each_browser
+    if metafunc.config.getoption("browser_loop", default=False):
+        return
+    
+    # Skip tests that already parametrize browser_profile themselves
+    # (e.g. browser × data combinations from utils.matrix.sampled_matrix)
+    for marker in metafunc.definition.iter_markers('parametrize'):
+        argnames = marker.args[0] if marker.args else marker.kwargs.get('argnames', ())
+        if isinstance(argnames, str):
+            argnames = [name.strip() for name in argnames.split(',')]
+        if 'browser_profile' in argnames:
+            return
+    
+    # Parametrize the test with each browser profile in the matrix
+    matrix_to_use, profile_ids = _resolve_browser_matrix(metafunc.config)
+    
     metafunc.parametrize(
         'browser_profile',
         matrix_to_use,
         ids=profile_ids,
-        scope='function'
+        scope='session'
     )
     
     logger.debug(
-        f"Parametrized {metafunc.function.__name__} with "
-        f"{len(matrix_to_use)} browser profiles"
+        "Parametrized {} with {} browser profiles",
+        metafunc.function.__name__, len(matrix_to_use)
     )
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Tag browser-matrix tests with an xdist group per browser profile.
+    
+    With `pytest -n auto --dist=loadgroup`, all tests for one browser
+    profile run on the same worker, so pooled browsers (see _browser_pool)
+    are reused instead of relaunched on every worker.
+    Without --dist=loadgroup the marker has no effect. Runs first so the
+    marker is in place before xdist's own hook turns xdist_group markers
+    into the '@group' node ID suffix it schedules by.
+    """
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or "browser_profile" not in callspec.params:
+            continue
+        profile_name = callspec.params["browser_profile"].get("name", "unknown")
+        item.add_marker(pytest.mark.xdist_group(name=f"browser-{profile_name}"))
+
+
+@pytest.fixture(scope="session")
+def config_loader() -> ConfigLoader:
+    """
+    Session-scoped fixture providing a shared ConfigLoader.
+    
+    Returns the process-wide loader, so fixtures, page objects and
+    DriverFactory all share one set of parsed configuration files.
+    """
+    return get_config_loader()
+
+
+@pytest.fixture(scope="session")
+def reports_run_dir() -> Path:
+    """
+    Session-scoped fixture providing this run's report directory.
+    
+    All xdist workers share the run directory chosen by the controller;
+    under xdist this is the worker's own subdirectory of it.
+    """
+    return _REPORTS_RUN_DIR
+
+
 @pytest.fixture(scope="session")
-def config() -> dict:
+def config(config_loader: ConfigLoader) -> dict:
     """Session-scoped fixture providing loaded configuration."""
-    config_loader = ConfigLoader()
     configuration = config_loader.load_config("config")
     logger.info("Configuration loaded")
     return configuration
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def browser_profile(request) -> Dict[str, Any]:
     """
-    Function-scoped fixture providing the current browser profile dictionary.
+    Session-scoped fixture providing the current browser profile dictionary.
     
     This fixture is injected by pytest_generate_tests during collection time.
-    Each test receives one browser profile from the matrix.
+    Each test receives one browser profile from the matrix. The parameter
+    is session-scoped, so pytest orders tests profile by profile and each
+    pooled browser is used in one contiguous run.
     
     Note: This fixture is automatically parametrized by pytest_generate_tests,
     so you don't need to use @pytest.mark.parametrize manually.
@@ -153,6 +284,11 @@ def browser_profile(request) -> Dict[str, Any]:
     if hasattr(request, 'param'):
         return request.param
     
+    # With --browser-loop the matrix is not parametrized; use its first profile
+    if request.config.getoption("browser_loop", default=False):
+        matrix_to_use, _ = _resolve_browser_matrix(request.config)
+        return matrix_to_use[0]
+    
     # Fallback: if not parametrized, return a minimal default profile
     # This should not normally happen if pytest_generate_tests is working correctly
     logger.warning("browser_profile not parametrized, using default")
@@ -164,61 +300,247 @@ def browser_profile(request) -> Dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def _playwright_session() -> Generator['Playwright', None, None]:
+    """
+    Session-scoped Playwright instance shared by all pooled browsers.
+    
+    The sync API allows one running Playwright instance per thread, so
+    browsers for different profiles must be launched from the same one.
+    """
+    from playwright.sync_api import sync_playwright
+    
+    playwright = sync_playwright().start()
+    
+    yield playwright
+    
+    playwright.stop()
+
+
+@pytest.fixture(scope="session")
+def _browser_pool(
+    _playwright_session: 'Playwright'
+) -> Generator[Dict[tuple, 'DriverFactory'], None, None]:
+    """
+    Session-scoped pool of started browsers, one per browser profile.
+    
+    Keyed by (profile name, remote, remote_url). Launching a browser takes
+    seconds, opening a context takes milliseconds, so driver and
+    shared_driver open fresh contexts on these browsers instead of
+    launching their own. All browsers are closed when the session ends.
+    """
+    pool: Dict[tuple, 'DriverFactory'] = {}
+    
+    yield pool
+    
+    for key, factory in pool.items():
+        try:
+            factory.quit_driver()
+        except Exception as e:
+            logger.error(f"Cleanup error ({key[0]}): {e}")
+
+
+def _get_started_factory(
+    playwright: 'Playwright',
+    pool: Dict[tuple, 'DriverFactory'],
+    browser_profile: Dict[str, Any],
+    remote: bool,
+    remote_url: Optional[str]
+) -> 'DriverFactory':
+    """
+    Return the pooled DriverFactory for a profile, launching its browser once.
+    
+    Args:
+        playwright: Session Playwright instance
+        pool: Session browser pool
+        browser_profile: Browser profile dictionary
+        remote: Whether the browser runs remotely
+        remote_url: Remote Grid/Moon URL
+        
+    Returns:
+        DriverFactory with a started browser
+    """
+    pool_key = (browser_profile.get('name', 'unknown'), remote, remote_url)
+    factory = pool.get(pool_key)
+    if factory is None:
+        from core.driver_factory import DriverFactory
+        
+        factory = DriverFactory(
+            browser_profile=browser_profile,
+            remote=remote,
+            remote_url=remote_url
+        )
+        factory.start_browser(playwright=playwright)
+        pool[pool_key] = factory
+    return factory
+
+
 @pytest.fixture(scope="function")
-def driver(browser_profile: Dict[str, Any], request) -> Generator[Page, None, None]:
+def driver(
+    browser_profile: Dict[str, Any],
+    config_loader: ConfigLoader,
+    _playwright_session: 'Playwright',
+    _browser_pool: Dict[tuple, 'DriverFactory'],
+    _screenshot_executor: ThreadPoolExecutor,
+    request
+) -> Generator['Page', None, None]:
     """
     Function-scoped fixture providing fresh Playwright Page instance.
     
     This fixture:
     - Receives a browser_profile from pytest_generate_tests parametrization
     - Detects remote execution from markers (@pytest.mark.remote) or CLI flags (--remote)
-    - Creates a new isolated browser session for each test
+    - Opens a new BrowserContext for each test on a browser launched once
+      per session and profile
     - Handles cleanup and failure screenshot capture
-    - Ensures no browser state is shared between tests
+    - Ensures no browser state (cookies, storage, cache) is shared between tests
     - Integrates with ReportingManager for logging remote sessions
     """
-    logger.info("=" * 70)
-    logger.info(f"Setup: {browser_profile.get('name', 'unknown')}")
-    
-    factory = None
     page_instance = None
     
     # Determine if test should run remote
     remote = _should_run_remote(request, browser_profile)
-    remote_url = _get_remote_url(request, browser_profile)
-    
-    if remote:
-        logger.info(f"Remote execution: {remote_url}")
+    remote_url = _get_remote_url(request, browser_profile, config_loader)
+    
+    # Bound once per test; records carry test/browser as structured extras,
+    # and the positional args are only formatted if the record is emitted
+    profile_name = browser_profile.get('name', 'unknown')
+    test_logger = logger.bind(test=request.node.name, browser=profile_name)
+    test_logger.debug(
+        "▶ {} browser={} remote={}",
+        request.node.name, profile_name, remote_url if remote else False
+    )
     
     try:
-        # Create driver with the current browser profile and remote settings
-        factory = DriverFactory(
-            browser_profile=browser_profile,
-            remote=remote,
-            remote_url=remote_url
+        factory = _get_started_factory(
+            _playwright_session, _browser_pool, browser_profile, remote, remote_url
         )
-        page_instance = factory.get_driver()
-        logger.info(f"✓ Driver ready: {browser_profile.get('name', 'unknown')}")
+        page_instance = factory.new_page()
         
         yield page_instance
         
     except Exception as e:
-        logger.error(f"✗ Driver setup failed: {e}")
-        if factory:
-            try:
-                factory.quit_driver()
-            except Exception:
-                pass
+        test_logger.error("✗ Driver setup failed: {}", e)
         raise
     
     finally:
-        _handle_test_failure(browser_profile, page_instance)
-        if factory:
+        if page_instance is not None:
+            if _call_failed(request):
+                _capture_failure_screenshot(
+                    request, browser_profile, page_instance, _screenshot_executor
+                )
             try:
-                factory.quit_driver()
+                page_instance.context.close()
             except Exception as e:
-                logger.error(f"Cleanup error: {e}")
-        logger.info("=" * 70)
+                test_logger.error("Cleanup error: {}", e)
+
+
+@pytest.fixture(scope="function")
+def for_each_browser(
+    config_loader: ConfigLoader,
+    _playwright_session: 'Playwright',
+    _browser_pool: Dict[tuple, 'DriverFactory'],
+    request
+) -> Callable[[Callable[['Page', Dict[str, Any]], None]], None]:
+    """
+    Function-scoped fixture looping one test body over the browser matrix.
+    
+    Collects as a single test node instead of one node per profile; meant
+    for serial runs with --browser-loop. Each profile gets a fresh context
+    on its pooled browser, closed after the body returns. The first failing
+    profile stops the loop and fails the test.
+    
+    Usage:
+        def test_home(for_each_browser):
+            def check(page, profile):
+                page.goto("https://example.com")
+                assert page.title()
+            for_each_browser(check)
+    """
+    def run(body: Callable[['Page', Dict[str, Any]], None]) -> None:
+        matrix_to_use, _ = _resolve_browser_matrix(request.config)
+        for profile in matrix_to_use:
+            remote = _should_run_remote(request, profile)
+            remote_url = _get_remote_url(request, profile, config_loader)
+            factory = _get_started_factory(
+                _playwright_session, _browser_pool, profile, remote, remote_url
+            )
+            page_instance = factory.new_page()
+            try:
+                body(page_instance, profile)
+            finally:
+                try:
+                    page_instance.context.close()
+                except Exception as e:
+                    logger.error(f"Cleanup error ({profile.get('name', 'unknown')}): {e}")
+    
+    return run
+
+
+@pytest.fixture(scope="module")
+def _shared_page_pool() -> Generator[Dict[tuple, 'Page'], None, None]:
+    """
+    Module-scoped pool of pages for shared_driver.
+    
+    Keyed by (profile name, remote, remote_url). Each page lives in its own
+    context on the session browser; contexts are closed when the module
+    finishes.
+    """
+    pool: Dict[tuple, 'Page'] = {}
+    
+    yield pool
+    
+    for key, page_instance in pool.items():
+        try:
+            page_instance.context.close()
+        except Exception as e:
+            logger.error(f"Cleanup error ({key[0]}): {e}")
+
+
+@pytest.fixture(scope="function")
+def shared_driver(
+    browser_profile: Dict[str, Any],
+    config_loader: ConfigLoader,
+    _playwright_session: 'Playwright',
+    _browser_pool: Dict[tuple, 'DriverFactory'],
+    _shared_page_pool: Dict[tuple, 'Page'],
+    _screenshot_executor: ThreadPoolExecutor,
+    request
+) -> Generator['Page', None, None]:
+    """
+    Function-scoped fixture providing a Playwright Page shared across a module.
+    
+    Use instead of 'driver' for data-driven tests whose rows do not depend on
+    each other: one context and page are opened per module and browser
+    profile, and cookies are cleared and the page reset to about:blank
+    before each test.
+    
+    Tests that need full isolation (e.g. E2E flows) should keep using 'driver'.
+    """
+    remote = _should_run_remote(request, browser_profile)
+    remote_url = _get_remote_url(request, browser_profile, config_loader)
+    pool_key = (browser_profile.get('name', 'unknown'), remote, remote_url)
+    
+    page_instance = _shared_page_pool.get(pool_key)
+    if page_instance is None:
+        logger.info(f"Setup (shared): {browser_profile.get('name', 'unknown')}")
+        factory = _get_started_factory(
+            _playwright_session, _browser_pool, browser_profile, remote, remote_url
+        )
+        page_instance = factory.new_page()
+        _shared_page_pool[pool_key] = page_instance
+    
+    # Reset state left behind by the previous test
+    page_instance.context.clear_cookies()
+    page_instance.goto("about:blank")
+    
+    try:
+        yield page_instance
+    finally:
+        if _call_failed(request):
+            _capture_failure_screenshot(
+                request, browser_profile, page_instance, _screenshot_executor
+            )
 
 
 def _should_run_remote(request: Any, browser_profile: Dict[str, Any]) -> bool:
@@ -249,7 +571,11 @@ def _should_run_remote(request: Any, browser_profile: Dict[str, Any]) -> bool:
     return False
 
 
-def _get_remote_url(request: Any, browser_profile: Dict[str, Any]) -> Optional[str]:
+def _get_remote_url(
+    request: Any,
+    browser_profile: Dict[str, Any],
+    config_loader: ConfigLoader
+) -> Optional[str]:
     """
     Get remote URL from multiple sources in priority order:
     1. CLI --remote-url flag
@@ -260,7 +586,7 @@ def _get_remote_url(request: Any, browser_profile: Dict[str, Any]) -> Optional[s
     # Check CLI flag first
     remote_url_cli = request.config.getoption("--remote-url", default=None)
     if remote_url_cli:
-        logger.debug(f"Using remote URL from CLI: {remote_url_cli}")
+        logger.debug("Using remote URL from CLI: {}", remote_url_cli)
         return remote_url_cli
     
     # Check marker for remote URL specification
@@ -268,25 +594,24 @@ def _get_remote_url(request: Any, browser_profile: Dict[str, Any]) -> Optional[s
     marker = request.node.get_closest_marker('remote')
     if marker and marker.args and len(marker.args) > 0:
         remote_url_marker = marker.args[0]
-        logger.debug(f"Using remote URL from marker: {remote_url_marker}")
+        logger.debug("Using remote URL from marker: {}", remote_url_marker)
         return remote_url_marker
     
     # Check browser profile
     profile_url = browser_profile.get('remote_url')
     if profile_url:
-        logger.debug(f"Using remote URL from browser profile: {profile_url}")
+        logger.debug("Using remote URL from browser profile: {}", profile_url)
         return profile_url
     
     # Check framework config
     try:
-        config_loader = ConfigLoader()
         framework_config = config_loader.get_all('config')
         config_url = framework_config.get('remote_url')
         if config_url:
-            logger.debug(f"Using remote URL from config: {config_url}")
+            logger.debug("Using remote URL from config: {}", config_url)
             return config_url
-    except Exception:
-        pass
+    except Exception as e:
+        logger.debug("Could not read remote URL from config: {}", e)
     
     logger.debug("No remote URL found")
     return None
@@ -294,19 +619,31 @@ def _get_remote_url(request: Any, browser_profile: Dict[str, Any]) -> Optional[s
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
-    """Session-level setup and teardown."""
-    logger.info("=" * 80)
-    logger.info("Test Session Started")
-    logger.info("=" * 80)
+    """
+    Session-level setup and teardown.
     
-    for directory in ["reports", "reports/screenshots", "reports/allure-results", "logs"]:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+    Output directories are created once in pytest_configure.
+    """
+    logger.info("Test Session Started")
     
     yield
     
-    logger.info("=" * 80)
     logger.info("Test Session Completed")
-    logger.info("=" * 80)
+
+
+@pytest.fixture(scope="session")
+def _screenshot_executor() -> Generator[ThreadPoolExecutor, None, None]:
+    """
+    Session-scoped thread pool that writes failure screenshots to disk.
+    
+    Drained at session end so every submitted screenshot is on disk
+    before pytest exits.
+    """
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+    
+    yield executor
+    
+    executor.shutdown(wait=True)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -340,34 +677,99 @@ def pytest_addoption(parser):
              "(e.g., https://moon.example.com/wd/hub). "
              "Only used if --remote flag is set."
     )
+    parser.addoption(
+        "--exhaustive",
+        "--full-matrix",
+        dest="exhaustive",
+        action="store_true",
+        default=False,
+        help="Run the full cross-product for tests parametrized with "
+             "utils.matrix.covering_pairs/sampled_matrix instead of the "
+             "covering subset."
+    )
+    parser.addoption(
+        "--browser-loop",
+        dest="browser_loop",
+        action="store_true",
+        default=False,
+        help="Do not parametrize tests over the browser matrix. Tests using "
+             "'driver' run once on the first profile; tests using "
+             "'for_each_browser' loop over all profiles in a single node."
+    )
 
 
-def _handle_test_failure(browser_profile: Dict[str, Any], page_instance: Page) -> None:
-    """Capture screenshot on test failure."""
-    try:
-        # This function is called in the finally block, but we need request context
-        # The actual failure check happens in _capture_failure_screenshot
-        # For now, we'll try to capture based on page state
-        if page_instance:
-            _capture_failure_screenshot(browser_profile, page_instance)
-    except Exception as e:
-        logger.warning(f"Could not handle test failure: {e}")
+def _call_failed(request: Any) -> bool:
+    """
+    Check whether the test's call phase failed.
+    
+    Relies on the rep_call attribute set by pytest_runtest_makereport.
+    
+    Args:
+        request: Pytest request of the test
+        
+    Returns:
+        True if the test body ran and failed
+    """
+    rep_call = getattr(request.node, "rep_call", None)
+    return rep_call is not None and rep_call.failed
 
 
 def _capture_failure_screenshot(
+    request: Any,
     browser_profile: Dict[str, Any],
-    page_instance: Page
+    page_instance: 'Page',
+    executor: ThreadPoolExecutor
 ) -> None:
     """
-    Capture and attach screenshot on failure.
-    
-    Note: This is called opportunistically in the finally block.
-    A more robust approach would integrate with pytest hooks to check actual failure status.
+    Capture and attach a screenshot of a failed test.
+    
+    Called from the driver fixtures' teardown, only when _call_failed(),
+    before the page's context is closed. The viewport is captured once in memory and attached to the
+    report directly; writing the standalone PNG to the run's screenshots
+    directory is handed to a background thread so teardown does not wait
+    on disk I/O.
+    
+    Args:
+        request: Pytest request of the test
+        browser_profile: Browser profile the test ran on
+        page_instance: Page to capture
+        executor: Session executor for background writes
     """
-    if not page_instance:
-        logger.warning("Cannot capture screenshot: page instance not available")
+    if _SCREENSHOTS_DIR is None:
+        return
+    
+    try:
+        png_bytes = page_instance.screenshot(full_page=False, timeout=2000)
+    except Exception as e:
+        logger.warning(f"Could not capture failure screenshot: {e}")
         return
     
-    # In a production setup, you would check request.node.rep_call.failed here
-    # For now, this is a placeholder that can be integrated with proper failure detection
+    safe_name = _SAFE_NAME_RE.sub('_', request.node.name)
+    screenshot_path = _SCREENSHOTS_DIR / f"{safe_name}.png"
+    
+    from reporting.manager import ReportingManager
+    
+    try:
+        ReportingManager.reporter().attach_image(
+            f"Failure - {browser_profile.get('name', 'unknown')}",
+            png_bytes
+        )
+    except Exception as e:
+        logger.debug(f"Could not attach failure screenshot: {e}")
+    
+    executor.submit(_write_screenshot, screenshot_path, png_bytes)
+
 
+def _write_screenshot(path: Path, png_bytes: bytes) -> None:
+    """
+    Write screenshot bytes to disk (runs on the screenshot executor).
+    
+    Args:
+        path: Destination file
+        png_bytes: PNG data
+    """
+    try:
+        path.write_bytes(png_bytes)
+        logger.info(f"Failure screenshot saved: {path}")
+    except Exception as e:
+        logger.warning(f"Could not save failure screenshot {path}: {e}")
@@ -4,14 +4,120 @@ Responsible for creating and managing Playwright browser instances.
 Supports both local and remote execution with retry mechanisms.
 """
 
+import os
+import signal
 import time
 import json
+import random
+import threading
 import urllib.parse
+from collections.abc import Mapping
 from typing import Optional, Dict, Any, Union
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Playwright
 from loguru import logger
 
-from config.config_loader import ConfigLoader
+from config.config_loader import get_config_loader, thaw
+from reporting.manager import ReportingManager
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json serializer
+    orjson = None
+
+
+# Upper bound (seconds) for closing the browser in DriverFactory._cleanup()
+_CLOSE_TIMEOUT_S = 5.0
+
+# Map browser names to Playwright browser types (also used for remote capabilities)
+_BROWSER_TYPE_MAP = {
+    'chromium': 'chromium',
+    'chrome': 'chromium',
+    'msedge': 'chromium',
+    'edge': 'chromium',
+    'firefox': 'firefox',
+    'webkit': 'webkit',
+    'safari': 'webkit'
+}
+
+
+def _kill_process(pid: int) -> bool:
+    """
+    Kill a local process by id.
+    
+    Args:
+        pid: Process id
+        
+    Returns:
+        True if the signal was delivered
+    """
+    try:
+        os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        return True
+    except OSError as e:
+        logger.warning(f"Failed to kill process {pid}: {e}")
+        return False
+
+
+def _kill_driver_process(playwright: Playwright) -> None:
+    """
+    Kill the Node driver process behind a Playwright instance.
+    
+    Last resort when closing a browser hangs and its process id is unknown
+    (remote browsers, non-Chromium engines): once the driver is gone the
+    pending call fails with a connection error. The process is only
+    reachable through Playwright internals, so this is best effort, and it
+    takes down every other browser of that Playwright instance.
+    
+    Args:
+        playwright: Playwright instance started by this process
+    """
+    impl = getattr(playwright, '_impl_obj', None)
+    connection = getattr(impl, '_connection', None)
+    transport = getattr(connection, '_transport', None)
+    proc = getattr(transport, '_proc', None)
+    if proc is None:
+        logger.warning("Cannot kill the Playwright driver: process handle not found")
+        return
+    try:
+        proc.kill()
+    except Exception as e:
+        logger.warning(f"Failed to kill the Playwright driver: {e}")
+
+
+def _dumps_json(data: Any, indent: bool = False) -> str:
+    """
+    Serialize data to a JSON string, using orjson when installed.
+    
+    Args:
+        data: JSON-serializable object
+        indent: Pretty-print with a two-space indent
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    return json.dumps(data, indent=2 if indent else None)
+
+
+def _encode_capabilities(capabilities: Dict[str, Any]) -> str:
+    """
+    Serialize capabilities to compact JSON and percent-encode it for a URL.
+    
+    orjson already returns UTF-8 bytes, so they are quoted directly without
+    an intermediate str.
+    
+    Args:
+        capabilities: Remote capabilities dictionary
+        
+    Returns:
+        URL-encoded JSON string
+    """
+    if orjson is not None:
+        caps_bytes = orjson.dumps(capabilities)
+    else:
+        caps_bytes = json.dumps(capabilities).encode('utf-8')
+    return urllib.parse.quote_from_bytes(caps_bytes)
 
 
 class RemoteCapabilitiesMapper:
@@ -30,19 +136,20 @@ class RemoteCapabilitiesMapper:
         Returns:
             Dictionary of remote capabilities
         """
+        get = browser_profile.get
         capabilities = {
             "browserName": RemoteCapabilitiesMapper._get_browser_name(
-                browser_profile.get('browserName', 'chromium')
+                get('browserName', 'chromium')
             ),
         }
         
         # Add browser version if specified
-        browser_version = browser_profile.get('browserVersion')
+        browser_version = get('browserVersion')
         if browser_version and browser_version.lower() != 'latest':
             capabilities["browserVersion"] = str(browser_version)
         
         # Add viewport configuration
-        viewport = browser_profile.get('viewport')
+        viewport = get('viewport')
         if viewport:
             capabilities["viewport"] = {
                 "width": viewport.get('width', 1920),
@@ -50,21 +157,23 @@ class RemoteCapabilitiesMapper:
             }
         
         # Add headless flag if explicitly set
-        headless = browser_profile.get('headless')
+        headless = get('headless')
         if headless is not None:
             capabilities["headless"] = bool(headless)
         
         # Platform name for Grid compatibility
-        platform_name = browser_profile.get('platformName')
+        platform_name = get('platformName')
         if platform_name:
             capabilities["platformName"] = platform_name
         
         # Add any Moon/Grid-specific options
-        remote_options = browser_profile.get('remote_options', {})
+        remote_options = get('remote_options', {})
         if remote_options:
-            capabilities.update(remote_options)
+            capabilities = {**capabilities, **remote_options}
         
-        logger.debug(f"Mapped remote capabilities: {json.dumps(capabilities, indent=2)}")
+        logger.opt(lazy=True).debug(
+            "Mapped remote capabilities: {}", lambda: _dumps_json(capabilities, indent=True)
+        )
         return capabilities
     
     @staticmethod
@@ -78,16 +187,7 @@ class RemoteCapabilitiesMapper:
         Returns:
             Standard browser name for Grid (chromium, firefox, webkit)
         """
-        name_map = {
-            'chromium': 'chromium',
-            'chrome': 'chromium',
-            'msedge': 'chromium',
-            'edge': 'chromium',
-            'firefox': 'firefox',
-            'webkit': 'webkit',
-            'safari': 'webkit'
-        }
-        return name_map.get(browser_name.lower(), 'chromium')
+        return _BROWSER_TYPE_MAP.get(browser_name.lower(), 'chromium')
 
 
 class DriverFactory:
@@ -128,7 +228,7 @@ class DriverFactory:
             remote: Override remote flag from profile or config
             remote_url: Override remote URL from profile or config
         """
-        self.config_loader = ConfigLoader()
+        self.config_loader = get_config_loader()
         
         # Load framework config
         self.framework_config = self.config_loader.get_all('config')
@@ -143,13 +243,13 @@ class DriverFactory:
             # Load profile by name from browsers.yaml
             self.browser_profile = self._load_browser_profile_by_name(browser_profile)
             self.profile_name = browser_profile
-        elif isinstance(browser_profile, dict):
-            # Use provided dictionary as profile
-            self.browser_profile = browser_profile.copy()
+        elif isinstance(browser_profile, Mapping):
+            # Use a mutable copy of the provided (possibly read-only) profile
+            self.browser_profile = thaw(browser_profile)
             self.profile_name = browser_profile.get('name', 'custom_profile')
         else:
             raise TypeError(
-                f"browser_profile must be None, str, or dict, got {type(browser_profile)}"
+                f"browser_profile must be None, str, or mapping, got {type(browser_profile)}"
             )
         
         # Determine remote execution mode
@@ -172,16 +272,41 @@ class DriverFactory:
                     "Will attempt to use Playwright's default Grid URL."
                 )
         
+        # WebSocket scheme and host for remote connections, parsed once
+        self._ws_scheme: Optional[str] = None
+        self._ws_host: Optional[str] = None
+        if self.remote_url:
+            parsed_url = urllib.parse.urlparse(self.remote_url)
+            self._ws_scheme = 'wss' if parsed_url.scheme == 'https' else 'ws'
+            self._ws_host = parsed_url.netloc
+        
         # Playwright objects
         self._playwright: Optional[Playwright] = None
+        self._owns_playwright = False
+        # OS process id of a locally launched Chromium, killed if closing hangs
+        self._browser_pid: Optional[int] = None
+        
+        # Playwright browser type (chromium, firefox, webkit) for this profile
+        self._browser_type_name = self._get_browser_type_name()
+        # Launch options are built on the first launch and reused by retries
+        self._launch_options: Optional[Dict[str, Any]] = None
+        # URL-encoded remote capabilities, built on the first remote connect
+        self._encoded_caps: Optional[str] = None
+        
+        # Per-context settings depend only on the profile and framework
+        # config, so they are built once and reused by every new_page()
+        self._context_options: Optional[Dict[str, Any]] = None
+        self._blocked_resource_types: Optional[frozenset] = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
         
         logger.info(
-            f"DriverFactory initialized - Profile: {self.profile_name}, "
-            f"Browser: {self.browser_profile.get('browserName', 'unknown')}, "
-            f"Remote: {self.remote}, Remote URL: {self.remote_url or 'N/A'}"
+            "DriverFactory initialized - Profile: {}, Browser: {}, Remote: {}, Remote URL: {}",
+            self.profile_name,
+            self.browser_profile.get('browserName', 'unknown'),
+            self.remote,
+            self.remote_url or 'N/A'
         )
     
     def _load_browser_profile_by_name(self, browser_name: str) -> Dict[str, Any]:
@@ -200,8 +325,8 @@ class DriverFactory:
         try:
             config = self.config_loader.get_browser_config(browser_name)
             profile = {"name": browser_name}
-            profile.update(config)
-            logger.debug(f"Loaded browser profile: {browser_name}")
+            profile.update(thaw(config))
+            logger.debug("Loaded browser profile: {}", browser_name)
             return profile
         except ValueError as e:
             logger.error(f"Failed to load browser profile: {e}")
@@ -215,21 +340,9 @@ class DriverFactory:
             Browser type name (chromium, firefox, webkit)
         """
         browser_name = self.browser_profile.get('browserName', 'chromium')
-        
-        # Map browser names to Playwright browser types
-        browser_type_map = {
-            'chromium': 'chromium',
-            'chrome': 'chromium',
-            'msedge': 'chromium',
-            'edge': 'chromium',
-            'firefox': 'firefox',
-            'webkit': 'webkit',
-            'safari': 'webkit'
-        }
-        
-        playwright_browser = browser_type_map.get(browser_name.lower(), 'chromium')
-        logger.debug(f"Mapped {browser_name} to Playwright type: {playwright_browser}")
-        return playwright_browser
+        browser_type_name = _BROWSER_TYPE_MAP.get(browser_name.lower(), 'chromium')
+        logger.debug("Mapped {} to Playwright type: {}", browser_name, browser_type_name)
+        return browser_type_name
     
     def _get_launch_options(self) -> Dict[str, Any]:
         """
@@ -238,33 +351,31 @@ class DriverFactory:
         Returns:
             Dictionary of browser launch options
         """
-        options = {}
-        
-        # Headless mode
-        headless = self.browser_profile.get(
-            'headless',
-            self.framework_config.get('headless', False)
-        )
-        options['headless'] = headless
-        
-        # Browser arguments
-        args = self.browser_profile.get('args', [])
-        if args:
-            options['args'] = args
+        # Channel for chromium-based browsers
+        channel = None
+        if self._browser_type_name == 'chromium':
+            browser_name = self.browser_profile.get('browserName', '').lower()
+            if browser_name in ['chrome', 'msedge', 'edge']:
+                channel = browser_name if browser_name != 'edge' else 'msedge'
         
         # Slow motion for debugging (if needed)
         slow_mo = self.framework_config.get('slow_motion', 0)
-        if slow_mo > 0:
-            options['slow_mo'] = slow_mo
         
-        # Channel for chromium-based browsers
-        browser_type_name = self._get_browser_type_name()
-        if browser_type_name == 'chromium':
-            browser_name = self.browser_profile.get('browserName', '').lower()
-            if browser_name in ['chrome', 'msedge', 'edge']:
-                options['channel'] = browser_name if browser_name != 'edge' else 'msedge'
+        options = {
+            'headless': self.browser_profile.get(
+                'headless',
+                self.framework_config.get('headless', False)
+            ),
+        }
+        # Optional settings are only passed when set
+        optional = {
+            'args': self.browser_profile.get('args', []),
+            'slow_mo': slow_mo if slow_mo > 0 else None,
+            'channel': channel,
+        }
+        options.update({key: value for key, value in optional.items() if value})
         
-        logger.debug(f"Launch options prepared: {options}")
+        logger.debug("Launch options prepared: {}", options)
         return options
     
     def _get_context_options(self) -> Dict[str, Any]:
@@ -274,46 +385,205 @@ class DriverFactory:
         Returns:
             Dictionary of browser context options
         """
-        options = {}
-        
-        # Viewport size
+        # Viewport size, falling back to the framework default
         viewport = self.browser_profile.get('viewport')
         if viewport:
-            options['viewport'] = {
+            viewport = {
                 'width': viewport.get('width', 1920),
                 'height': viewport.get('height', 1080)
             }
         else:
-            # Default viewport from framework config
-            options['viewport'] = {
+            viewport = {
                 'width': self.framework_config.get('browser_width', 1920),
                 'height': self.framework_config.get('browser_height', 1080)
             }
         
-        # User agent (optional)
-        user_agent = self.framework_config.get('user_agent')
-        if user_agent:
-            options['user_agent'] = user_agent
+        options = {
+            'viewport': viewport,
+            'locale': self.framework_config.get('locale', 'en-US'),
+            # Accept downloads (only tests that download files need it)
+            'accept_downloads': self.framework_config.get('accept_downloads', False),
+            # Service workers add registration/caching work to every navigation
+            'service_workers': self.framework_config.get('service_workers', 'block'),
+            'java_script_enabled': self.framework_config.get('js_enabled', True),
+            # Skip CSS animations/transitions
+            'reduced_motion': self.framework_config.get('reduced_motion', 'reduce'),
+        }
+        # Optional settings are only passed when configured; video recording
+        # stays disabled unless a directory is set
+        optional = {
+            'user_agent': self.framework_config.get('user_agent'),
+            'timezone_id': self.framework_config.get('timezone'),
+            'permissions': self.framework_config.get('permissions', []),
+            'record_video_dir': self.framework_config.get('record_video_dir'),
+        }
+        options.update({key: value for key, value in optional.items() if value})
+        
+        logger.debug("Context options prepared: {}", options)
+        return options
+    
+    def _ensure_playwright(self) -> Playwright:
+        """
+        Start a Playwright instance unless one was provided.
+        
+        Returns:
+            Playwright instance
+        """
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+            self._owns_playwright = True
+        return self._playwright
+    
+    def _launch_local_browser(self) -> Browser:
+        """
+        Start Playwright and launch a local browser.
         
-        # Locale
-        locale = self.framework_config.get('locale', 'en-US')
-        options['locale'] = locale
+        Returns:
+            Playwright Browser instance
+        """
+        logger.info("Creating local browser instance...")
         
-        # Timezone
-        timezone = self.framework_config.get('timezone')
-        if timezone:
-            options['timezone_id'] = timezone
+        self._ensure_playwright()
         
-        # Accept downloads
-        options['accept_downloads'] = True
+        # Get browser type
+        browser_type_name = self._browser_type_name
+        browser_type = getattr(self._playwright, browser_type_name)
         
-        # Permissions
-        permissions = self.framework_config.get('permissions', [])
-        if permissions:
-            options['permissions'] = permissions
+        # Launch browser
+        if self._launch_options is None:
+            self._launch_options = self._get_launch_options()
+        self._browser = browser_type.launch(**self._launch_options)
+        if browser_type_name == 'chromium':
+            self._browser_pid = self._get_browser_pid(self._browser)
+        logger.info("Browser launched successfully: {}", browser_type_name)
+        return self._browser
+    
+    @staticmethod
+    def _get_browser_pid(browser: Browser) -> Optional[int]:
+        """
+        Look up the OS process id of a local Chromium browser over CDP.
         
-        logger.debug(f"Context options prepared: {options}")
-        return options
+        Args:
+            browser: Launched Chromium browser
+            
+        Returns:
+            Browser process id, or None if it cannot be determined
+        """
+        try:
+            session = browser.new_browser_cdp_session()
+            try:
+                info = session.send("SystemInfo.getProcessInfo")
+            finally:
+                session.detach()
+        except Exception as e:
+            logger.debug("Could not read the browser process id: {}", e)
+            return None
+        for process in info.get('processInfo', []):
+            if process.get('type') == 'browser':
+                return process.get('id')
+        return None
+    
+    def _connect_remote_browser(self) -> Browser:
+        """
+        Connect to a remote browser via Playwright Grid / Moon.
+        
+        Uses Playwright's browserType.connect() to establish a websocket connection
+        to the Moon/Grid instance, passing capabilities via the URL query parameters.
+        
+        Returns:
+            Playwright Browser instance connected to the remote browser
+            
+        Raises:
+            ValueError: If remote URL is not configured
+        """
+        if not self.remote_url:
+            raise ValueError(
+                "Remote execution requested but remote_url not configured. "
+                "Set remote_url in browser profile or config."
+            )
+        
+        logger.info("Connecting to remote Grid/Moon at: {}", self.remote_url)
+        
+        self._ensure_playwright()
+        
+        # Get browser type (chromium, firefox, webkit)
+        browser_type_name = self._browser_type_name
+        browser_type = getattr(self._playwright, browser_type_name)
+        
+        # Map profile to remote capabilities and encode them for the URL
+        if self._encoded_caps is None:
+            capabilities = RemoteCapabilitiesMapper.map_to_remote_capabilities(
+                self.browser_profile
+            )
+            self._encoded_caps = _encode_capabilities(capabilities)
+            logger.debug("Encoded capabilities: {}", self._encoded_caps)
+        encoded_caps = self._encoded_caps
+        
+        # Construct Moon WebSocket Endpoint
+        # Format: ws://MOON_HOST/playwright/{browser}?capabilities={json}
+        ws_endpoint = (
+            f"{self._ws_scheme}://{self._ws_host}/playwright/{browser_type_name}"
+            f"?capabilities={encoded_caps}"
+        )
+        logger.info("Connecting to Moon endpoint: {}", ws_endpoint)
+        
+        # Connect to Moon
+        self._browser = browser_type.connect(ws_endpoint)
+        logger.info("Successfully connected to remote browser")
+        
+        # Log remote session info
+        self._log_remote_session_info()
+        
+        return self._browser
+    
+    def new_page(self) -> Page:
+        """
+        Open a fresh BrowserContext and Page on the already started browser.
+        
+        Each call gets its own context (cookies, storage, cache), so tests
+        stay isolated while sharing one browser process. The caller owns the
+        page and should close it with page.context.close().
+        
+        Note: For remote browsers, viewport and other options are handled by
+        Moon via capabilities, but context options are still passed for
+        client-side behaviors like locale/timezone.
+        
+        Returns:
+            Playwright Page object in a new context
+            
+        Raises:
+            RuntimeError: If the browser has not been started
+        """
+        if self._browser is None:
+            raise RuntimeError("Browser not started. Call start_browser() first.")
+        
+        if self._context_options is None:
+            self._context_options = self._get_context_options()
+            self._blocked_resource_types = frozenset(
+                self.framework_config.get('blocked_resource_types') or ()
+            )
+        
+        context = self._browser.new_context(**self._context_options)
+        logger.debug("Browser context created")
+        
+        # Skip downloading resources tests don't need (images, fonts, ...)
+        blocked_types = self._blocked_resource_types
+        if blocked_types:
+            context.route(
+                "**/*",
+                lambda route: route.abort()
+                if route.request.resource_type in blocked_types
+                else route.continue_()
+            )
+            logger.opt(lazy=True).debug("Blocking resource types: {}", lambda: sorted(blocked_types))
+        
+        page = context.new_page()
+        logger.debug("Page created successfully")
+        
+        # Set default timeouts
+        self._apply_timeouts(page)
+        
+        return page
     
     def _create_local_driver(self) -> Page:
         """
@@ -326,32 +596,10 @@ class DriverFactory:
             Exception: If driver creation fails
         """
         try:
-            logger.info("Creating local browser instance...")
-            
-            # Start Playwright
-            self._playwright = sync_playwright().start()
-            
-            # Get browser type
-            browser_type_name = self._get_browser_type_name()
-            browser_type = getattr(self._playwright, browser_type_name)
-            
-            # Launch browser
-            launch_options = self._get_launch_options()
-            self._browser = browser_type.launch(**launch_options)
-            logger.info(f"Browser launched successfully: {browser_type_name}")
-            
-            # Create context
-            context_options = self._get_context_options()
-            self._context = self._browser.new_context(**context_options)
-            logger.info("Browser context created")
-            
-            # Create page
-            self._page = self._context.new_page()
+            self._launch_local_browser()
+            self._page = self.new_page()
+            self._context = self._page.context
             logger.info("Page created successfully")
-            
-            # Set default timeouts
-            self._apply_timeouts()
-            
             return self._page
             
         except Exception as e:
@@ -363,9 +611,6 @@ class DriverFactory:
         """
         Create a remote browser instance via Playwright Grid / Moon.
         
-        Uses Playwright's browserType.connect() to establish a websocket connection
-        to the Moon/Grid instance, passing capabilities via the URL query parameters.
-        
         Returns:
             Playwright Page object connected to remote browser
             
@@ -374,61 +619,10 @@ class DriverFactory:
             Exception: If remote connection fails
         """
         try:
-            if not self.remote_url:
-                raise ValueError(
-                    "Remote execution requested but remote_url not configured. "
-                    "Set remote_url in browser profile or config."
-                )
-            
-            logger.info(f"Connecting to remote Grid/Moon at: {self.remote_url}")
-            
-            # Start Playwright
-            self._playwright = sync_playwright().start()
-            
-            # Get browser type (chromium, firefox, webkit)
-            browser_type_name = self._get_browser_type_name()
-            browser_type = getattr(self._playwright, browser_type_name)
-            
-            # Map profile to remote capabilities
-            capabilities = RemoteCapabilitiesMapper.map_to_remote_capabilities(
-                self.browser_profile
-            )
-            
-            # Encode capabilities for URL
-            caps_json = json.dumps(capabilities)
-            encoded_caps = urllib.parse.quote(caps_json)
-            logger.debug(f"Encoded capabilities: {encoded_caps}")
-            
-            # Construct Moon WebSocket Endpoint
-            # Format: ws://MOON_HOST/playwright/{browser}?capabilities={json}
-            parsed_url = urllib.parse.urlparse(self.remote_url)
-            scheme = 'wss' if parsed_url.scheme == 'https' else 'ws'
-            host = parsed_url.netloc
-            
-            ws_endpoint = f"{scheme}://{host}/playwright/{browser_type_name}?capabilities={encoded_caps}"
-            logger.info(f"Connecting to Moon endpoint: {ws_endpoint}")
-            
-            # Connect to Moon
-            self._browser = browser_type.connect(ws_endpoint)
-            logger.info("Successfully connected to remote browser")
-            
-            # Create context
-            # Note: Viewport and other options are handled by Moon via capabilities,
-            # but we pass context options for client-side behaviors like locale/timezone
-            context_options = self._get_context_options()
-            self._context = self._browser.new_context(**context_options)
-            logger.info("Remote browser context created")
-            
-            # Create page
-            self._page = self._context.new_page()
+            self._connect_remote_browser()
+            self._page = self.new_page()
+            self._context = self._page.context
             logger.info("Remote page created successfully")
-            
-            # Set default timeouts
-            self._apply_timeouts()
-            
-            # Log remote session info
-            self._log_remote_session_info()
-            
             return self._page
             
         except Exception as e:
@@ -439,7 +633,7 @@ class DriverFactory:
     def _log_remote_session_info(self) -> None:
         """Log remote session information for debugging and reporting."""
         try:
-            if not self.remote or not self._page:
+            if not self.remote or not self._browser:
                 return
             
             session_info = {
@@ -451,85 +645,115 @@ class DriverFactory:
                 "headless": self.browser_profile.get('headless', False)
             }
             
-            logger.info(f"Remote Session Info: {json.dumps(session_info, indent=2)}")
+            # Serialized once for both the log and the report
+            payload = _dumps_json(session_info)
+            logger.info("Remote Session Info: {}", payload)
             
             # TODO: Integrate with ReportingManager to attach to Allure report
-            from reporting.manager import ReportingManager
             try:
-                ReportingManager.log_info(f"Remote Session: {json.dumps(session_info)}")
+                ReportingManager.log_info(f"Remote Session: {payload}")
             except Exception as e:
-                logger.debug(f"Could not log to ReportingManager: {e}")
+                logger.debug("Could not log to ReportingManager: {}", e)
         except Exception as e:
             logger.warning(f"Failed to log remote session info: {e}")
     
-    def _apply_timeouts(self) -> None:
-        """Apply default timeouts to the page from configuration."""
-        if self._page is None:
-            return
+    def _apply_timeouts(self, page: Page) -> None:
+        """
+        Apply default timeouts to a page from configuration.
         
+        Args:
+            page: Playwright Page to configure
+        """
         try:
             # Default timeout for all operations
             default_timeout = self.framework_config.get('default_timeout', 10) * 1000
-            self._page.set_default_timeout(default_timeout)
+            page.set_default_timeout(default_timeout)
             
             # Navigation timeout
             page_load_timeout = self.framework_config.get('page_load_timeout', 30) * 1000
-            self._page.set_default_navigation_timeout(page_load_timeout)
+            page.set_default_navigation_timeout(page_load_timeout)
             
             # Element timeout (used for locator operations)
             element_timeout = self.framework_config.get('element_timeout', 5) * 1000
             
             logger.debug(
-                f"Timeouts applied - Default: {default_timeout}ms, "
-                f"Navigation: {page_load_timeout}ms, "
-                f"Element: {element_timeout}ms"
+                "Timeouts applied - Default: {}ms, Navigation: {}ms, Element: {}ms",
+                default_timeout, page_load_timeout, element_timeout
             )
         except Exception as e:
             logger.warning(f"Failed to apply timeouts: {e}")
     
-    def get_driver(self, max_retries: Optional[int] = None) -> Page:
+    def _run_with_retries(self, create, max_retries: Optional[int] = None):
         """
-        Get a ready-to-use Playwright Page instance with retry mechanism.
+        Run a browser creation step, retrying on failure.
+        
+        The first attempt runs directly; retry settings are only read
+        once it has failed.
         
         Args:
-            max_retries: Maximum number of retry attempts. 
+            create: Zero-argument callable performing the creation
+            max_retries: Maximum number of retry attempts.
                         If None, uses value from config.yaml
         
         Returns:
-            Playwright Page object ready for test execution
+            Whatever create() returns
             
         Raises:
-            Exception: If driver creation fails after all retries
+            Exception: If creation fails after all retries
+        """
+        try:
+            result = create()
+        except Exception as e:
+            logger.error(f"✗ Driver creation failed on attempt 1: {e}")
+            # Cleanup any partial resources
+            self._cleanup()
+            return self._retry(create, e, max_retries)
+        
+        logger.info("✓ Driver created successfully on attempt 1")
+        return result
+    
+    def _retry(self, create, error: Exception, max_retries: Optional[int] = None):
+        """
+        Retry a failed browser creation step.
+        
+        Args:
+            create: Zero-argument callable performing the creation
+            error: Exception raised by the first attempt
+            max_retries: Maximum number of retry attempts.
+                        If None, uses value from config.yaml
+        
+        Returns:
+            Whatever create() returns
+            
+        Raises:
+            Exception: If creation fails after all retries
         """
         if max_retries is None:
             max_retries = self.framework_config.get('retries', 2)
         
-        retry_delay = self.framework_config.get('retry_delay', 1)
+        if max_retries <= 0:
+            logger.error("Failed to create driver after 1 attempts")
+            raise error
         
-        last_exception = None
+        retry_delay = self.framework_config.get('retry_delay', 1)
         
-        for attempt in range(max_retries + 1):
+        for attempt in range(1, max_retries + 1):
             try:
-                if attempt > 0:
-                    logger.info(
-                        f"Retry attempt {attempt}/{max_retries} "
-                        f"for driver creation..."
-                    )
-                    time.sleep(retry_delay)
-                
-                # Create driver based on execution mode
-                if self.remote:
-                    driver = self._create_remote_driver()
-                else:
-                    driver = self._create_local_driver()
-                
+                # Exponential backoff with a little jitter: a warming-up Grid
+                # gets a quick retry, one that is down is not hammered
+                delay = retry_delay * (1 << (attempt - 1)) + random.uniform(0, 0.1)
                 logger.info(
-                    f"✓ Driver created successfully on attempt {attempt + 1}"
+                    "Retry attempt {}/{} for driver creation in {:.2f}s...",
+                    attempt, max_retries, delay
                 )
-                return driver
+                time.sleep(delay)
+                
+                result = create()
+                
+                logger.info("✓ Driver created successfully on attempt {}", attempt + 1)
+                return result
                 
             except Exception as e:
-                last_exception = e
                 logger.error(
                     f"✗ Driver creation failed on attempt {attempt + 1}: {e}"
                 )
@@ -543,27 +767,141 @@ class DriverFactory:
                         f"Failed to create driver after {max_retries + 1} attempts"
                     )
                     raise
+    
+    def start_browser(
+        self,
+        max_retries: Optional[int] = None,
+        playwright: Optional[Playwright] = None
+    ) -> Browser:
+        """
+        Launch (or connect to) the browser without opening a page.
         
-        # Should not reach here, but just in case
-        raise last_exception if last_exception else Exception("Driver creation failed")
+        Use together with new_page() to share one browser process across
+        many isolated contexts. Calling it again returns the running browser.
+        
+        Args:
+            max_retries: Maximum number of retry attempts.
+                        If None, uses value from config.yaml
+            playwright: Running Playwright instance to launch the browser
+                        with. Only one sync Playwright instance can run per
+                        thread, so callers starting several browsers should
+                        share one. The caller keeps ownership and stops it.
+        
+        Returns:
+            Playwright Browser instance
+            
+        Raises:
+            Exception: If the browser cannot be started after all retries
+        """
+        if self._browser is None:
+            launch = self._connect_remote_browser if self.remote else self._launch_local_browser
+            
+            def _launch() -> Browser:
+                # _cleanup() drops the reference after a failed attempt
+                if playwright is not None:
+                    self._playwright = playwright
+                return launch()
+            
+            self._run_with_retries(_launch, max_retries)
+        return self._browser
+    
+    def get_driver(self, max_retries: Optional[int] = None) -> Page:
+        """
+        Get a ready-to-use Playwright Page instance with retry mechanism.
+        
+        Args:
+            max_retries: Maximum number of retry attempts. 
+                        If None, uses value from config.yaml
+        
+        Returns:
+            Playwright Page object ready for test execution
+            
+        Raises:
+            Exception: If driver creation fails after all retries
+        """
+        create = self._create_remote_driver if self.remote else self._create_local_driver
+        return self._run_with_retries(create, max_retries)
     
     def _cleanup(self) -> None:
-        """Clean up browser resources."""
+        """
+        Clean up browser resources.
+        
+        Never raises: errors are logged, so a failing close cannot replace
+        the error that triggered the cleanup (e.g. a failed start in
+        _run_with_retries). Closing is bounded by _CLOSE_TIMEOUT_S for every
+        factory, pooled ones included: Playwright's sync objects can only be
+        used from the thread that created them and close() takes no timeout,
+        so a watchdog thread kills the browser process instead, which makes
+        the pending close() return. Playwright is stopped even if closing
+        fails, so a stuck browser does not also leave the driver running.
+        """
+        browser = self._browser or (self._context.browser if self._context else None)
+        watchdog = None
         try:
-            if self._page:
-                self._page.close()
-                self._page = None
-            if self._context:
-                self._context.close()
-                self._context = None
-            if self._browser:
-                self._browser.close()
-                self._browser = None
-            if self._playwright:
-                self._playwright.stop()
-                self._playwright = None
+            # Calls on a dead connection never return; its objects are gone anyway
+            if browser is not None and not browser.is_connected():
+                logger.warning("Browser already disconnected, skipping close")
+            elif self._browser or self._context or self._page:
+                watchdog = threading.Timer(
+                    _CLOSE_TIMEOUT_S, self._on_close_timeout,
+                    args=(self._browser_pid, self._playwright)
+                )
+                watchdog.daemon = True
+                watchdog.start()
+                # Closing an owner closes everything it contains, so only the
+                # outermost open object needs a close round-trip
+                if self._browser:
+                    self._browser.close(reason="test teardown")
+                elif self._context:
+                    self._context.close()
+                else:
+                    self._page.close()
         except Exception as e:
             logger.warning(f"Error during cleanup: {e}")
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+            self._page = None
+            self._context = None
+            self._browser = None
+            self._browser_pid = None
+            if self._playwright:
+                try:
+                    # A shared Playwright instance is stopped by its owner
+                    if self._owns_playwright:
+                        self._playwright.stop()
+                except Exception as e:
+                    logger.warning(f"Error stopping Playwright: {e}")
+                self._playwright = None
+                self._owns_playwright = False
+    
+    @staticmethod
+    def _on_close_timeout(browser_pid: Optional[int], playwright: Optional[Playwright]) -> None:
+        """
+        Watchdog callback for _cleanup(): unblock a hung close.
+        
+        Kills the browser process when its id is known, which leaves the
+        Playwright driver (and any browsers sharing it) running; otherwise
+        falls back to killing the driver.
+        
+        Args:
+            browser_pid: OS process id of the browser, if known
+            playwright: Playwright instance the browser was started with
+        """
+        if browser_pid is not None:
+            logger.error(
+                f"Closing the browser took over {_CLOSE_TIMEOUT_S}s, killing browser process {browser_pid}"
+            )
+            if _kill_process(browser_pid):
+                return
+        if playwright is None:
+            logger.error("Cannot unblock the browser close: no Playwright instance")
+            return
+        logger.error(
+            f"Closing the browser took over {_CLOSE_TIMEOUT_S}s, killing the Playwright driver "
+            "(best effort; other browsers on this Playwright instance are lost)"
+        )
+        _kill_driver_process(playwright)
     
     def quit_driver(self) -> None:
         """
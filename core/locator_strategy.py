@@ -3,11 +3,59 @@ LocatorUtility Module
 Provides multi-locator fallback mechanism for element identification.
 """
 
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, Tuple
 from playwright.sync_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import Error as PlaywrightError
 from loguru import logger
 
 
+# Budget (ms) for re-checking a cached Locator before it is reused
+_CACHE_RECHECK_MS = 250
+
+
+# Selectors that match purely by id: '#X' (CSS) and '//tag[@id="X"]' (XPath)
+_CSS_ID_RE = re.compile(r'^#([A-Za-z_][\w-]*)$')
+_XPATH_ID_RE = re.compile(r'^//(?:\*|[A-Za-z][\w-]*)\[@id=(["\'])([^"\']+)\1\]$')
+
+
+# For each element (a list of [type, value] pairs in priority order), returns
+# the index of the first entry that matches exactly one visible element - the
+# entry find_element() would settle on - or -1. Evaluation stops at entries
+# that cannot be checked here (text/role, invalid selectors, a single hidden
+# match) so a lower-priority entry is never picked over them.
+_BATCH_VISIBLE_JS = """
+(elements) => elements.map((selectors) => {
+    for (let i = 0; i < selectors.length; i++) {
+        const [type, value] = selectors[i];
+        if (!value) continue;
+        let matches;
+        try {
+            if (type === 'xpath') {
+                const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                matches = [];
+                for (let j = 0; j < result.snapshotLength; j++) matches.push(result.snapshotItem(j));
+            } else if (type === 'css' || type === 'id') {
+                matches = [...document.querySelectorAll(type === 'id' ? '#' + CSS.escape(value) : value)];
+            } else {
+                return -1;
+            }
+        } catch (e) {
+            return -1;
+        }
+        // Playwright's strict mode rejects locators matching several elements
+        if (matches.length !== 1) continue;
+        const el = matches[0];
+        if (!(el instanceof Element)) return -1;
+        const rect = el.getBoundingClientRect();
+        const visible = rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+        return visible ? i : -1;
+    }
+    return -1;
+})
+"""
+
+
 class LocatorUtility:
     """
     Utility class for handling multiple locators per element with fallback mechanism.
@@ -27,6 +75,133 @@ class LocatorUtility:
         """
         self.page = page
         self.timeout = timeout
+        
+        # Locators found by find_element(), keyed by the (type, value)
+        # pairs of their locator list. Entries are re-checked before reuse;
+        # call clear_cache() after navigating so the fallback chain is
+        # walked again on the new page.
+        self._resolved: Dict[Tuple, Locator] = {}
+    
+    def clear_cache(self) -> None:
+        """Forget the Locators resolved by find_element()."""
+        self._resolved.clear()
+    
+    @staticmethod
+    def _cache_key(locators: List[Dict[str, str]]) -> Tuple:
+        """
+        Build the _resolved cache key for a locator list.
+        
+        Args:
+            locators: List of locator dictionaries
+            
+        Returns:
+            Hashable tuple of (type, value) pairs
+        """
+        return tuple((d.get('type', ''), d.get('value', '')) for d in locators)
+    
+    def _cached(self, key: Tuple) -> Optional[Locator]:
+        """
+        Return the cached Locator for key if it is still visible.
+        
+        A short wait guards against reusing a fallback chosen on a previous
+        page after a navigation the cache was not told about; an entry that
+        fails the check is dropped.
+        
+        Args:
+            key: Cache key from _cache_key()
+            
+        Returns:
+            Cached Locator, or None if there is none or it is no longer visible
+        """
+        cached = self._resolved.get(key)
+        if cached is None:
+            return None
+        try:
+            cached.wait_for(state='visible', timeout=min(self.timeout, _CACHE_RECHECK_MS))
+        except PlaywrightError:
+            del self._resolved[key]
+            return None
+        return cached
+    
+    def build_locator(self, locator_type: str, locator_value: str) -> Optional[Locator]:
+        """
+        Build a Playwright Locator for a single locator definition.
+        
+        Args:
+            locator_type: One of 'xpath', 'css', 'id', 'text', 'role'
+            locator_value: Selector value
+            
+        Returns:
+            Playwright Locator, or None if the type is unknown
+        """
+        if locator_type == 'xpath':
+            return self.page.locator(f"xpath={locator_value}")
+        if locator_type == 'css':
+            return self.page.locator(locator_value)
+        if locator_type == 'id':
+            return self.page.locator(f"#{locator_value}")
+        if locator_type == 'text':
+            return self.page.get_by_text(locator_value)
+        if locator_type == 'role':
+            return self.page.get_by_role(locator_value)
+        return None
+    
+    def _attempt_timeout(self, idx: int, total: int) -> int:
+        """
+        Visibility budget for the idx-th (1-based) of total fallback locators.
+        
+        Earlier locators get an exponentially growing share of the timeout,
+        starting at a tenth of it, so a broken primary fails fast; the last
+        locator always gets the full timeout. Never 0, which Playwright
+        treats as "no timeout".
+        
+        Args:
+            idx: Position of the locator in the list (1-based)
+            total: Number of locators in the list
+            
+        Returns:
+            Timeout in milliseconds
+        """
+        if idx >= total:
+            return self.timeout
+        return max(1, min(self.timeout, int(self.timeout // 10) * 2 ** (idx - 1)))
+    
+    @staticmethod
+    def dedupe_equivalent(locators: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Drop locators that select the same element by id as an earlier one.
+        
+        An 'id' entry, a '#X' CSS selector and a '//tag[@id="X"]' XPath all
+        look up the same element, so once one of them has failed the others
+        would only wait out the same timeout.
+        
+        Args:
+            locators: List of locator dictionaries
+            
+        Returns:
+            Locator list in the original order without id duplicates
+        """
+        seen_ids = set()
+        unique = []
+        for locator_dict in locators:
+            locator_type = locator_dict.get('type', '').lower()
+            locator_value = locator_dict.get('value', '')
+            element_id = None
+            if locator_type == 'id':
+                element_id = locator_value
+            elif locator_type == 'css':
+                match = _CSS_ID_RE.match(locator_value)
+                element_id = match.group(1) if match else None
+            elif locator_type == 'xpath':
+                match = _XPATH_ID_RE.match(locator_value)
+                element_id = match.group(2) if match else None
+            
+            if element_id:
+                if element_id in seen_ids:
+                    continue
+                seen_ids.add(element_id)
+            unique.append(locator_dict)
+        return unique
     
     def find_element(
         self,
@@ -36,6 +211,10 @@ class LocatorUtility:
         """
         Find element using multiple locator strategies with fallback.
         
+        The Locator that matched is remembered, so later calls with the same
+        locator list only re-check that it is still visible instead of
+        retrying the fallback chain, until clear_cache() is called.
+        
         Args:
             locators: List of locator dictionaries, each with 'type' and 'value'
                      Example: [{'type': 'xpath', 'value': '//button[@id="btn"]'},
@@ -58,7 +237,15 @@ class LocatorUtility:
         if not locators:
             raise ValueError(f"{element_name}: No locators provided")
         
+        key = self._cache_key(locators)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        
         errors = []
+        locators = self.dedupe_equivalent(locators)
+        
+        total = len(locators)
         
         for idx, locator_dict in enumerate(locators, start=1):
             locator_type = locator_dict.get('type', '').lower()
@@ -70,45 +257,36 @@ class LocatorUtility:
             
             try:
                 logger.debug(
-                    f"{element_name} [Locator {idx}/{len(locators)}]: "
-                    f"Attempting {locator_type.upper()}: {locator_value}"
+                    "{} [Locator {}/{}]: Attempting {}: {}",
+                    element_name, idx, total, locator_type.upper(), locator_value
                 )
                 
-                # Get locator based on type
-                if locator_type == 'xpath':
-                    locator = self.page.locator(f"xpath={locator_value}")
-                elif locator_type == 'css':
-                    locator = self.page.locator(locator_value)
-                elif locator_type == 'id':
-                    locator = self.page.locator(f"#{locator_value}")
-                elif locator_type == 'text':
-                    locator = self.page.get_by_text(locator_value)
-                elif locator_type == 'role':
-                    locator = self.page.get_by_role(locator_value)
-                else:
+                locator = self.build_locator(locator_type, locator_value)
+                if locator is None:
                     logger.warning(f"{element_name} [Locator {idx}]: Unknown type '{locator_type}', skipping")
                     continue
                 
                 # Verify element exists and is visible
-                locator.wait_for(state='visible', timeout=self.timeout)
+                locator.wait_for(state='visible', timeout=self._attempt_timeout(idx, total))
                 
                 logger.info(
-                    f"{element_name} [Locator {idx}/{len(locators)}]: ✓ SUCCESS with "
-                    f"{locator_type.upper()}: {locator_value}"
+                    "{} [Locator {}/{}]: ✓ SUCCESS with {}: {}",
+                    element_name, idx, total, locator_type.upper(), locator_value
                 )
+                self._resolved[key] = locator
                 return locator
                 
             except PlaywrightTimeoutError as e:
                 error_msg = f"{locator_type.upper()}: {locator_value} - Element not visible within timeout"
-                logger.debug(f"{element_name} [Locator {idx}/{len(locators)}]: ✗ FAILED - {error_msg}")
+                logger.debug("{} [Locator {}/{}]: ✗ FAILED - {}", element_name, idx, total, error_msg)
                 errors.append(error_msg)
             except Exception as e:
                 error_msg = f"{locator_type.upper()}: {locator_value} - {str(e)}"
-                logger.debug(f"{element_name} [Locator {idx}/{len(locators)}]: ✗ FAILED - {error_msg}")
+                logger.debug("{} [Locator {}/{}]: ✗ FAILED - {}", element_name, idx, total, error_msg)
                 errors.append(error_msg)
         
         # All locators failed
-        error_summary = f"{element_name}: All {len(locators)} locator(s) failed:\n"
+        error_summary = f"{element_name}: All {total} locator(s) failed:\n"
         for idx, error in enumerate(errors, start=1):
             error_summary += f"  {idx}. {error}\n"
         
@@ -132,9 +310,9 @@ class LocatorUtility:
             locator_util.click_element(locators, "Submit Button")
         """
         element = self.find_element(locators, element_name)
-        logger.debug(f"{element_name}: Clicking element")
+        logger.debug("{}: Clicking element", element_name)
         element.click()
-        logger.info(f"{element_name}: ✓ Clicked successfully")
+        logger.info("{}: ✓ Clicked successfully", element_name)
     
     def type_text(
         self,
@@ -150,20 +328,20 @@ class LocatorUtility:
             locators: List of locator dictionaries
             text: Text to type
             element_name: Name of element for logging
-            clear_first: Whether to clear field before typing
+            clear_first: Kept for compatibility; fill() always replaces the
+                         field's value, so no separate clear is issued
             
         Usage:
             locators = [{'type': 'css', 'value': '#email'}]
             locator_util.type_text(locators, "test@example.com", "Email Field")
         """
         element = self.find_element(locators, element_name)
-        logger.debug(f"{element_name}: Typing text: '{text}'")
-        
-        if clear_first:
-            element.clear()
+        logger.debug("{}: Typing text: '{}'", element_name, text)
         
+        # fill() replaces the current value in one call; a preceding clear()
+        # would only add a round-trip
         element.fill(text)
-        logger.info(f"{element_name}: ✓ Text entered successfully")
+        logger.info("{}: ✓ Text entered successfully", element_name)
     
     def get_text(
         self,
@@ -185,7 +363,7 @@ class LocatorUtility:
         """
         element = self.find_element(locators, element_name)
         text = element.inner_text()
-        logger.debug(f"{element_name}: Retrieved text: '{text}'")
+        logger.debug("{}: Retrieved text: '{}'", element_name, text)
         return text
     
     def is_visible(
@@ -208,3 +386,56 @@ class LocatorUtility:
             return element.is_visible()
         except Exception:
             return False
+    
+    def ensure_visible_batch(
+        self,
+        elements: Dict[str, List[Dict[str, str]]]
+    ) -> Dict[str, Optional[Locator]]:
+        """
+        Check several elements for visibility in a single browser round-trip.
+        
+        Locators are considered in list order, like find_element(), and
+        elements found are cached for it. Only CSS, id and XPath locators are
+        evaluated; an element that cannot be settled that way is reported as
+        None, so callers fall back to the regular per-element wait for it.
+        Every element is evaluated, cached or not, so a cached Locator is
+        replaced or dropped when the page no longer agrees with it; only
+        cached entries the evaluation cannot settle get a short re-check.
+        
+        Args:
+            elements: Locator lists keyed by element name
+            
+        Returns:
+            Locator of the highest-priority visible entry keyed by element
+            name, or None (all None if the page is mid-navigation)
+            
+        Usage:
+            found = locator_util.ensure_visible_batch({
+                "Username Input": USERNAME_LOCATORS,
+                "Password Input": PASSWORD_LOCATORS,
+            })
+        """
+        found = {}
+        names = list(elements)
+        if not names:
+            return found
+        selectors = [
+            [[d.get('type', '').lower(), d.get('value', '')] for d in elements[name]]
+            for name in names
+        ]
+        try:
+            indexes = self.page.evaluate(_BATCH_VISIBLE_JS, selectors)
+        except PlaywrightError as e:
+            logger.debug("Batch visibility check failed: {}", e)
+            found.update(dict.fromkeys(names))
+            return found
+        
+        for name, entries, idx in zip(names, selectors, indexes):
+            key = self._cache_key(elements[name])
+            locator = self.build_locator(*entries[idx]) if idx >= 0 else None
+            if locator is not None:
+                self._resolved[key] = locator
+            else:
+                locator = self._cached(key)
+            found[name] = locator
+        return found
@@ -80,11 +80,13 @@ class AutomationStorePage(BasePage):
     
     def search_for_product(self, product_name: str) -> None:
         """
-        Complete search flow: enter text and click search.
-        Demonstrates multi-element interaction with fallback.
+        Complete search flow: enter text and submit with Enter.
+        Submitting from the input skips resolving the search button, so
+        only one fallback chain runs.
         """
-        self.enter_search_text(product_name)
-        self.click_search_button()
+        element = self.find_element(self.SEARCH_INPUT, "Search Input")
+        element.fill(product_name)
+        element.press("Enter")
     
     def navigate_to_login(self) -> None:
         """Navigate to login page."""
@@ -42,23 +42,32 @@ class CardPage(BasePage):
     def remove_all_cart_items(self) -> None:
         """
         Remove all items from the cart.
-        Iterates over all remove buttons and clicks them one by one.
+        Reads every remove link in one DOM query and requests them through
+        the page's APIRequestContext (same cookies as the page), so the cart
+        page is reloaded once instead of once per item.
+        
+        Raises:
+            Exception: If a removal request fails or items remain in the cart
         """
-        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-        while True:
-            try:
-                # Find all remove buttons (fresh after each removal)
-                remove_buttons = self.page.locator('a.btn.btn-sm.btn-default[href*="remove="]')
-                count = remove_buttons.count()
-                if count == 0:
-                    break
-                # Always click the first one (DOM updates after each click)
-                remove_buttons.nth(0).click()
-                self.wait_for_page_load()
-            except PlaywrightTimeoutError:
-                break
-            except Exception:
-                break
+        remove_links = self.page.locator('a.btn.btn-sm.btn-default[href*="remove="]')
+        hrefs = remove_links.evaluate_all("els => els.map(e => e.href)")
+        if not hrefs:
+            return
+        failed = []
+        for href in hrefs:
+            response = self.page.request.get(href)
+            if not response.ok:
+                failed.append(f"{href} returned {response.status}")
+        self.page.reload(wait_until='domcontentloaded')
+        self.locator_util.clear_cache()
+        remaining = remove_links.count()
+        if failed or remaining:
+            error_msg = (
+                f"Failed to empty cart: {remaining} item(s) left"
+                + (f"; failed requests: {', '.join(failed)}" if failed else "")
+            )
+            logger.error(error_msg)
+            raise Exception(error_msg)
 
         
 
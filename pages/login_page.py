@@ -275,6 +275,12 @@ class LoginPage(BasePage):
         """
         self.click_login_link()
         self.enter_username(username)
+        # The form is rendered once the username field is; check the other
+        # fields in one round-trip instead of waiting for each
+        self.prefetch_elements({
+            "Password Input": self.LOGIN_PASSWORD_INPUT,
+            "Login Submit Button": self.LOGIN_SUBMIT_BUTTON,
+        })
         self.enter_password(password)
         self.click_login()
         return self.is_welcome_back_visible()
@@ -1,11 +1,32 @@
 
 from asyncio.log import logger
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from core.base_page import BasePage
 import os
 
 
 class ProductsPage(BasePage):
         
+    # Price selectors, most specific first
+    PRICE_SELECTORS = [
+        {'type': 'css', 'value': '.price .oneprice'},
+        {'type': 'css', 'value': '.price .pricenew'},
+        {'type': 'css', 'value': '.price'},
+        {'type': 'xpath', 'value': '//div[contains(@class,"price")]'},
+    ]
+
+    # Returns the text of the first element matched by each selector (null
+    # where nothing matches), evaluated in the browser in one round-trip
+    _PRICE_TEXTS_JS = """
+    (selectors) => selectors.map(({type, value}) => {
+        const el = type === 'xpath'
+            ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(value);
+        return el ? el.innerText : null;
+    })
+    """
+
     ADD_TO_CART_BUTTON = [
         {'type': 'css', 'value': 'a.cart'},
         {'type': 'xpath', 'value': '//a[contains(@class,"cart")]'},
@@ -35,38 +56,44 @@ class ProductsPage(BasePage):
             screenshot_dir = os.path.join(str(base_dir), 'screenshots')
         os.makedirs(screenshot_dir, exist_ok=True)
         prices = []
-        for idx, url in enumerate(product_urls, 1):
-            print(f"Processing product {idx}: {url}")
-            self.navigate_to(url)
-            self.wait_for_page_load()
-            # Try to extract price before adding to cart
-            price = None
-            try:
-                # Try common price selectors
-                price_selectors = [
-                    {'type': 'css', 'value': '.price .oneprice'},
-                    {'type': 'css', 'value': '.price .pricenew'},
-                    {'type': 'css', 'value': '.price'},
-                    {'type': 'xpath', 'value': '//div[contains(@class,"price")]'},
-                ]
-                for sel in price_selectors:
+        # PNG files are written in the background so the next product's
+        # navigation starts right after the capture; each write is checked
+        # once the with block has waited for them
+        writes = []
+        with ThreadPoolExecutor(max_workers=2) as writer:
+            for idx, url in enumerate(product_urls, 1):
+                print(f"Processing product {idx}: {url}")
+                self.navigate_to(url)
+                # Try to extract price before adding to cart
+                price = None
+                try:
+                    price_texts = self.page.evaluate(self._PRICE_TEXTS_JS, self.PRICE_SELECTORS)
+                except Exception:
+                    price_texts = []
+                for price_text in price_texts:
+                    if price_text is None:
+                        continue
                     try:
-                        price_el = self.page.locator(sel['value'])
-                        if price_el.count() > 0:
-                            price_text = price_el.first.inner_text().replace(',', '').replace('₪', '').replace('$', '').strip()
-                            price = float(''.join(c for c in price_text if (c.isdigit() or c == '.')))
-                            break
-                    except Exception:
+                        price_text = price_text.replace(',', '').replace('₪', '').replace('$', '').strip()
+                        price = float(''.join(c for c in price_text if (c.isdigit() or c == '.')))
+                        break
+                    except ValueError:
                         continue
-            except Exception:
-                pass
-            if price is not None:
-                prices.append(price)
-            self.click(self.ADD_TO_CART_BUTTON, f"Add To Cart Button (product {idx})")
-            self.wait_for_page_load()
-            screenshot_path = os.path.join(screenshot_dir, f"product_{idx}_cart.png")
-            self.page.screenshot(path=screenshot_path, full_page=True)
-            logger.info(f"Saved screenshot for product {idx} to {screenshot_path}")
+                if price is not None:
+                    prices.append(price)
+                self.click(self.ADD_TO_CART_BUTTON, f"Add To Cart Button (product {idx})")
+                self.wait_for_page_load()
+                screenshot_path = os.path.join(screenshot_dir, f"product_{idx}_cart.png")
+                png = self.page.screenshot(full_page=True)
+                writes.append((screenshot_path, writer.submit(Path(screenshot_path).write_bytes, png)))
+                logger.info(f"Captured screenshot for product {idx}, writing to {screenshot_path}")
+        for screenshot_path, write in writes:
+            try:
+                write.result()
+            except OSError as e:
+                logger.error(f"Failed to save screenshot {screenshot_path}: {e}")
+                raise
+            logger.debug("Screenshot saved: {}", screenshot_path)
         budget_per_item = sum(prices) / len(prices) if prices else 0
         items_count = len(product_urls)
         return {"budgetPerItem": budget_per_item, "itemsCount": items_count}
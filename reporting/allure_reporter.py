@@ -6,7 +6,6 @@ All Allure-specific imports and logic are contained here.
 """
 
 import traceback
-from pathlib import Path
 from typing import Optional
 
 from reporting.reporter import Reporter
@@ -50,21 +49,36 @@ class AllureReporter(Reporter):
             path: File path to the screenshot
         """
         try:
-            screenshot_path = Path(path)
-            if not screenshot_path.exists():
-                return
-            
-            with open(screenshot_path, 'rb') as img:
-                self.allure.attach(
-                    img.read(),
-                    name=name,
-                    attachment_type=self.allure.attachment_type.PNG
-                )
+            # attach.file copies the file into the results directory
+            # without reading it into memory first; a missing file
+            # raises and is ignored below
+            self.allure.attach.file(
+                str(path),
+                name=name,
+                attachment_type=self.allure.attachment_type.PNG
+            )
         except Exception as e:
             # Silently fail if screenshot attachment fails
             # to avoid breaking test execution
             pass
     
+    def attach_image(self, name: str, content: bytes) -> None:
+        """
+        Attach in-memory PNG image data to the Allure report.
+        
+        Args:
+            name: Name/description for the image
+            content: PNG bytes
+        """
+        try:
+            self.allure.attach(
+                content,
+                name=name,
+                attachment_type=self.allure.attachment_type.PNG
+            )
+        except Exception:
+            pass
+    
     def attach_text(self, name: str, content: str) -> None:
         """
         Attach text content to the Allure report.
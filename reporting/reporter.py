@@ -4,6 +4,8 @@ Reporter Interface
 Abstract base class defining the contract for any reporting implementation.
 """
 
+import os
+import tempfile
 from abc import ABC, abstractmethod
 from typing import Optional
 from pathlib import Path
@@ -45,6 +47,33 @@ class Reporter(ABC):
         """
         pass
     
+    def attach_image(self, name: str, content: bytes) -> None:
+        """
+        Attach in-memory PNG image data to the test report.
+        
+        The default implementation writes the bytes to a temporary file,
+        passes it to attach_screenshot() and removes it afterwards. Reporters
+        that can attach bytes directly (or that read the file later) should
+        override this.
+        
+        Args:
+            name: Name/description for the image
+            content: PNG bytes (e.g. from page.screenshot())
+            
+        Example:
+            reporter.attach_image("Failure", page.screenshot())
+        """
+        fd, path = tempfile.mkstemp(suffix=".png")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            self.attach_screenshot(name, path)
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+    
     @abstractmethod
     def attach_text(self, name: str, content: str) -> None:
         """
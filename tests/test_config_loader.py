@@ -0,0 +1,48 @@
+"""
+Unit tests for config.config_loader (no browser required).
+"""
+
+import pytest
+
+from config.config_loader import ConfigLoader, freeze, thaw
+
+
+def test_freeze_is_read_only():
+    """Frozen mappings reject writes and lists become tuples, recursively."""
+    frozen = freeze({"timeouts": {"page": 30}, "browsers": ["chrome", "firefox"]})
+    
+    with pytest.raises(TypeError):
+        frozen["timeouts"] = {}
+    with pytest.raises(TypeError):
+        frozen["timeouts"]["page"] = 1
+    assert frozen["browsers"] == ("chrome", "firefox")
+
+
+def test_thaw_returns_mutable_copy():
+    """thaw() undoes freeze() without touching the frozen original."""
+    frozen = freeze({"timeouts": {"page": 30}, "browsers": ["chrome"]})
+    
+    thawed = thaw(frozen)
+    thawed["timeouts"]["page"] = 1
+    
+    assert thawed == {"timeouts": {"page": 1}, "browsers": ["chrome"]}
+    assert frozen["timeouts"]["page"] == 30
+
+
+def test_loaded_config_cannot_be_mutated(tmp_path):
+    """Configuration shared through the cache is read-only."""
+    (tmp_path / "config.yaml").write_text("base_url: http://example.test\nretries: 2\n", encoding="utf-8")
+    config = ConfigLoader(str(tmp_path)).load_config("config")
+    
+    with pytest.raises(TypeError):
+        config["retries"] = 5
+
+
+def test_get_resolves_nested_keys_and_defaults(tmp_path):
+    """get() resolves dot-notation keys, repeatedly, and falls back to the default."""
+    (tmp_path / "config.yaml").write_text("timeouts:\n  page: 30\n", encoding="utf-8")
+    loader = ConfigLoader(str(tmp_path))
+    
+    assert loader.get("timeouts.page") == 30
+    assert loader.get("timeouts.page") == 30
+    assert loader.get("timeouts.missing", default=5) == 5
@@ -10,6 +10,10 @@ Patterns shown:
 3. Multiple data formats (YAML, JSON, CSV)
 4. Proper error handling and logging
 
+The class-based examples use the 'shared_driver' fixture: data rows are
+independent, so one browser per module is reused instead of launching
+one per row.
+
 These tests are NOT meant to run against a real application.
 They serve as documentation and templates for implementing data-driven tests.
 """
@@ -36,14 +40,14 @@ class TestDataDrivenLoginExamples(BaseTest):
         load_test_data("test_data/login.yaml"),
         ids=lambda d: f"{d['username']}"  # Use username as test ID
     )
-    def test_login_with_yaml_data(self, driver, login_data: Dict[str, Any]):
+    def test_login_with_yaml_data(self, shared_driver, login_data: Dict[str, Any]):
         """
         Test login with credentials from YAML.
         
         Each test case is a separate test run with different credentials.
         
         Args:
-            driver: Playwright page fixture
+            shared_driver: Playwright page shared across this module
             login_data: Dict from login.yaml containing username, password, expected_role
         
         Example test IDs generated:
@@ -84,12 +88,12 @@ class TestDataDrivenSearchExamples(BaseTest):
         load_test_data("test_data/search.json"),
         ids=lambda d: f"{d['query']}"
     )
-    def test_search_with_json_data(self, driver, search_params: Dict[str, Any]):
+    def test_search_with_json_data(self, shared_driver, search_params: Dict[str, Any]):
         """
         Test product search with queries from JSON.
         
         Args:
-            driver: Playwright page fixture
+            shared_driver: Playwright page shared across this module
             search_params: Dict from search.json containing query, min_results, category
         """
         query = search_params["query"]
@@ -121,7 +125,7 @@ class TestDataDrivenUserExamples(BaseTest):
         load_test_data("test_data/users.csv"),
         ids=lambda d: f"{d['username']}"
     )
-    def test_user_creation_with_csv_data(self, driver, user: Dict[str, Any]):
+    def test_user_creation_with_csv_data(self, shared_driver, user: Dict[str, Any]):
         """
         Test user account creation with data from CSV.
         
@@ -129,7 +133,7 @@ class TestDataDrivenUserExamples(BaseTest):
         are automatically converted to dict keys.
         
         Args:
-            driver: Playwright page fixture
+            shared_driver: Playwright page shared across this module
             user: Dict from users.csv with user account information
         """
         username = user["username"]
@@ -168,14 +172,14 @@ class TestDataDrivenProductFilters(BaseTest):
     )
     def test_product_filtering_with_yaml_data(
         self,
-        driver,
+        shared_driver,
         filter_config: Dict[str, Any]
     ):
         """
         Test product filtering with various filter combinations.
         
         Args:
-            driver: Playwright page fixture
+            shared_driver: Playwright page shared across this module
             filter_config: Dict from product_filters.yaml with filter settings
         """
         filter_name = filter_config["filter_name"]
@@ -0,0 +1,58 @@
+"""
+Unit tests for utils.data_loader (no browser required).
+
+Covers the per-file cache behind load_test_data() and CSV converters.
+"""
+
+import os
+
+import pytest
+
+from utils.data_loader import DataLoaderError, load_test_data, parse_bool
+
+
+def _write_csv(path, text: str, mtime_ns: int) -> None:
+    """Write a CSV file and pin its mtime so cache keys are deterministic."""
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_cache_hit_returns_independent_copies(tmp_path):
+    """Mutating a returned row must not leak into later loads."""
+    data_file = tmp_path / "users.csv"
+    _write_csv(data_file, "username,age\nalice,30\n", 1_000_000_000)
+    
+    first = load_test_data(str(data_file))
+    first[0]["username"] = "mutated"
+    first.append({"username": "extra"})
+    
+    second = load_test_data(str(data_file))
+    assert second == [{"username": "alice", "age": "30"}]
+
+
+def test_mtime_change_forces_reread(tmp_path):
+    """An edited file (new mtime) is parsed again instead of served from cache."""
+    data_file = tmp_path / "users.csv"
+    _write_csv(data_file, "username\nalice\n", 1_000_000_000)
+    assert load_test_data(str(data_file)) == [{"username": "alice"}]
+    
+    _write_csv(data_file, "username\nbob\n", 2_000_000_000)
+    assert load_test_data(str(data_file)) == [{"username": "bob"}]
+
+
+def test_converters_are_applied(tmp_path):
+    """Converted columns are returned typed; other columns stay strings."""
+    data_file = tmp_path / "users.csv"
+    _write_csv(data_file, "username,age,is_admin\nalice,30,yes\n", 1_000_000_000)
+    
+    rows = load_test_data(str(data_file), converters={"age": int, "is_admin": parse_bool})
+    assert rows == [{"username": "alice", "age": 30, "is_admin": True}]
+
+
+def test_converter_failure_reports_line_number(tmp_path):
+    """A value the converter rejects raises DataLoaderError naming its line."""
+    data_file = tmp_path / "users.csv"
+    _write_csv(data_file, "username,age\nalice,30\nbob,old\n", 1_000_000_000)
+    
+    with pytest.raises(DataLoaderError, match=r"line 3: cannot convert column 'age'"):
+        load_test_data(str(data_file), converters={"age": int})
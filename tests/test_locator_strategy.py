@@ -0,0 +1,50 @@
+"""
+Unit tests for core.locator_strategy helpers (no browser required).
+"""
+
+import pytest
+
+from core.locator_strategy import LocatorUtility
+
+
+def test_dedupe_equivalent_drops_id_duplicates():
+    """'id', '#X' CSS and '//tag[@id="X"]' XPath select the same element."""
+    locators = [
+        {'type': 'id', 'value': 'submit'},
+        {'type': 'css', 'value': '#submit'},
+        {'type': 'xpath', 'value': '//button[@id="submit"]'},
+        {'type': 'css', 'value': 'button.submit'},
+    ]
+    
+    assert LocatorUtility.dedupe_equivalent(locators) == [
+        {'type': 'id', 'value': 'submit'},
+        {'type': 'css', 'value': 'button.submit'},
+    ]
+
+
+def test_dedupe_equivalent_keeps_distinct_ids_in_order():
+    """Different ids and non-id selectors are all kept, in list order."""
+    locators = [
+        {'type': 'xpath', 'value': "//input[@id='email']"},
+        {'type': 'css', 'value': '#password'},
+        {'type': 'css', 'value': 'form #email'},
+    ]
+    
+    assert LocatorUtility.dedupe_equivalent(locators) == locators
+
+
+@pytest.mark.parametrize("timeout", [0.5, 5, 9, 100, 5000])
+def test_attempt_timeout_is_never_zero(timeout):
+    """Playwright treats timeout=0 as 'no timeout', so attempts must stay >= 1 ms."""
+    util = LocatorUtility(page=None, timeout=timeout)
+    
+    for idx in range(1, 4):
+        assert 1 <= util._attempt_timeout(idx, 4) <= max(timeout, 1)
+    assert util._attempt_timeout(4, 4) == timeout
+
+
+def test_attempt_timeout_grows_and_last_gets_full_budget():
+    """Earlier locators get a growing share; the last one the full timeout."""
+    util = LocatorUtility(page=None, timeout=5000)
+    
+    assert [util._attempt_timeout(idx, 4) for idx in range(1, 5)] == [500, 1000, 2000, 5000]
@@ -0,0 +1,46 @@
+"""
+Unit tests for utils.matrix (no browser required).
+"""
+
+import itertools
+
+from utils import matrix
+from utils.matrix import covering_pairs, sampled_matrix
+
+
+def test_covering_pairs_use_every_value():
+    """Each value of both lists appears in max(len) combinations."""
+    users = ["u1", "u2", "u3"]
+    products = ["p1", "p2"]
+    
+    pairs = covering_pairs(users, products)
+    
+    assert len(pairs) == 3
+    assert {u for u, _ in pairs} == set(users)
+    assert {p for _, p in pairs} == set(products)
+
+
+def test_covering_pairs_empty_input():
+    """An empty dimension yields no combinations."""
+    assert covering_pairs([], ["p1"]) == []
+    assert covering_pairs(["u1"], []) == []
+
+
+def test_exhaustive_returns_full_product(monkeypatch):
+    """With EXHAUSTIVE set the full cross-product is returned."""
+    monkeypatch.setattr(matrix, "EXHAUSTIVE", True)
+    users = ["u1", "u2", "u3"]
+    products = ["p1", "p2"]
+    
+    assert covering_pairs(users, products) == list(itertools.product(users, products))
+
+
+def test_sampled_matrix_covers_browsers_and_rows():
+    """Every browser profile and every data row is scheduled at least once."""
+    browsers = [{"name": "chrome"}, {"name": "firefox"}]
+    rows = [{"id": 1}, {"id": 2}, {"id": 3}]
+    
+    combos = sampled_matrix(rows, browsers)
+    
+    assert {b["name"] for b, _ in combos} == {"chrome", "firefox"}
+    assert {r["id"] for _, r in combos} == {1, 2, 3}
@@ -18,19 +18,48 @@ Usage:
 """
 
 import csv
+import functools
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json parser
+    orjson = None
+
+
+# Project root, used to resolve relative data file paths
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 
 class DataLoaderError(Exception):
     """Raised when data loading or parsing fails."""
     pass
 
 
+_BOOL_VALUES = {"true": True, "yes": True, "1": True,
+                "false": False, "no": False, "0": False}
+
+
+def parse_bool(value: str) -> bool:
+    """
+    Convert a CSV cell such as "true"/"false" to a bool.
+    
+    Intended for use as a CSV column converter in load_test_data().
+    
+    Raises:
+        ValueError: If the value is not a recognized boolean literal
+    """
+    try:
+        return _BOOL_VALUES[value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean value: {value!r}")
+
+
 class DataLoader:
     """
     Unified loader for test data from YAML, JSON, or CSV files.
@@ -42,13 +71,18 @@ class DataLoader:
     SUPPORTED_FORMATS = {".yaml", ".yml", ".json", ".csv"}
     
     @staticmethod
-    def load(path: str) -> List[Dict[str, Any]]:
+    def load(
+        path: str,
+        converters: Optional[Dict[str, Callable[[str], Any]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Load test data from file. Auto-detects format by extension.
         
         Args:
             path: Path to data file (relative or absolute).
                   Supported formats: .yaml, .yml, .json, .csv
+            converters: Optional mapping of CSV column name to a callable
+                        that converts the raw string cell (CSV only).
         
         Returns:
             List[Dict[str, Any]]: Normalized test data.
@@ -95,7 +129,7 @@ class DataLoader:
             elif suffix == ".json":
                 data = DataLoader._load_json(file_path)
             elif suffix == ".csv":
-                data = DataLoader._load_csv(file_path)
+                data = DataLoader._load_csv(file_path, converters)
         except DataLoaderError:
             raise
         except Exception as e:
@@ -176,6 +210,8 @@ class DataLoader:
         """
         Load JSON file.
         
+        Uses orjson when installed, otherwise the stdlib json module.
+        
         Supports:
         - Direct list: [{ ... }, { ... }]
         - Root key: { "tests": [{ ... }, { ... }] }
@@ -189,8 +225,11 @@ class DataLoader:
         Raises:
             DataLoaderError: If format is invalid
         """
-        with open(path, "r", encoding="utf-8") as f:
-            content = json.load(f)
+        if orjson is not None:
+            content = orjson.loads(path.read_bytes())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                content = json.load(f)
         
         # Handle list directly
         if isinstance(content, list):
@@ -218,15 +257,21 @@ class DataLoader:
         )
     
     @staticmethod
-    def _load_csv(path: Path) -> List[Dict[str, Any]]:
+    def _load_csv(
+        path: Path,
+        converters: Optional[Dict[str, Callable[[str], Any]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Load CSV file.
         
         First row is treated as headers.
         Each subsequent row becomes a dict with headers as keys.
+        Columns listed in converters are typed once here, so tests
+        receive ready-to-use values instead of raw strings.
         
         Args:
             path: Path to CSV file
+            converters: Optional mapping of column name to converter callable
         
         Returns:
             List[Dict[str, Any]]
@@ -243,16 +288,49 @@ class DataLoader:
                 )
             
             rows = list(reader)
+            
+            # Only convert columns that actually exist in the header
+            active = [
+                (column, convert) for column, convert in (converters or {}).items()
+                if column in reader.fieldnames
+            ]
         
         if not rows:
             raise DataLoaderError(
                 f"CSV file {path.name} has no data rows (only headers)"
             )
         
+        for line_no, row in enumerate(rows, start=2):
+            for column, convert in active:
+                try:
+                    row[column] = convert(row[column])
+                except (TypeError, ValueError) as e:
+                    raise DataLoaderError(
+                        f"CSV file {path.name}, line {line_no}: "
+                        f"cannot convert column '{column}': {e}"
+                    )
+        
         return rows
 
 
-def load_test_data(path: str) -> List[Dict[str, Any]]:
+@functools.lru_cache(maxsize=None)
+def _load_cached(
+    path: str,
+    mtime_ns: int,
+    converters: Tuple[Tuple[str, Callable[[str], Any]], ...] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Parse a data file once per (absolute path, mtime, converters).
+    
+    The mtime is part of the cache key so edited files are re-read.
+    """
+    return DataLoader.load(path, dict(converters) or None)
+
+
+def load_test_data(
+    path: str,
+    converters: Optional[Dict[str, Callable[[str], Any]]] = None
+) -> List[Dict[str, Any]]:
     """
     Load test data from external file (YAML, JSON, or CSV).
     
@@ -263,6 +341,8 @@ def load_test_data(path: str) -> List[Dict[str, Any]]:
         path: Path to data file.
               Relative paths are resolved from project root.
               Supported formats: .yaml, .yml, .json, .csv
+        converters: Optional mapping of CSV column name to a callable
+                    applied to every cell in that column (e.g. int, parse_bool).
     
     Returns:
         List[Dict[str, Any]]: Test data ready for parametrization.
@@ -281,13 +361,28 @@ def load_test_data(path: str) -> List[Dict[str, Any]]:
         ...     page = LoginPage(driver)
         ...     page.login(user_data["username"], user_data["password"])
         ...     assert page.is_logged_in()
+        
+        >>> # Typed CSV columns
+        >>> users = load_test_data(
+        ...     "test_data/users.csv",
+        ...     converters={"age": int, "is_admin": parse_bool}
+        ... )
     """
     # Resolve relative paths from project root
     file_path = Path(path)
     if not file_path.is_absolute():
         # Try current directory first, then project root
         if not file_path.exists():
-            project_root = Path(__file__).parent.parent
-            file_path = project_root / path
+            file_path = _PROJECT_ROOT / path
+    
+    if not file_path.exists():
+        # Let DataLoader raise its standard "not found" error
+        return DataLoader.load(str(file_path), converters)
     
-    return DataLoader.load(str(file_path))
+    file_path = file_path.resolve()
+    # Copy each row so callers cannot mutate the cached dataset
+    return [dict(row) for row in _load_cached(
+        str(file_path),
+        file_path.stat().st_mtime_ns,
+        tuple((converters or {}).items())
+    )]
@@ -0,0 +1,85 @@
+"""
+Test Matrix Helpers
+
+Reduces stacked parametrization (users × products, browsers × data rows)
+to a covering subset where every value of each dimension still appears
+at least once.
+
+Usage:
+    from utils.matrix import covering_pairs
+
+    @pytest.mark.parametrize(
+        "user_data,product",
+        covering_pairs(load_test_data("test_data/users.csv"),
+                       load_test_data("test_data/products.json"))
+    )
+    def test_purchase(driver, user_data, product):
+        ...
+
+Browser profiles can be sampled together with data rows using
+sampled_matrix(); such tests parametrize 'browser_profile' themselves and
+are skipped by the browser-matrix hook in core/conftest.py.
+
+Run with --exhaustive (alias --full-matrix) to get the full cross-product back.
+"""
+
+import itertools
+from typing import Any, Dict, List, Sequence, Tuple
+
+
+# Set from the --exhaustive CLI option in core/conftest.py:pytest_configure.
+# Test modules are imported after pytest_configure, so decorators that call
+# covering_pairs() at import time see the final value.
+EXHAUSTIVE = False
+
+
+def covering_pairs(
+    first: Sequence[Any],
+    second: Sequence[Any]
+) -> List[Tuple[Any, Any]]:
+    """
+    Pair two value lists so every value of each list is used at least once.
+
+    Values are paired cyclically, producing max(len(first), len(second))
+    combinations instead of len(first) * len(second). The pairing is
+    deterministic, which keeps collection identical across xdist workers.
+
+    Args:
+        first: Values for the first parameter
+        second: Values for the second parameter
+
+    Returns:
+        List of (first_value, second_value) tuples. When EXHAUSTIVE is set,
+        the full cross-product is returned instead.
+    """
+    if EXHAUSTIVE:
+        return list(itertools.product(first, second))
+
+    if not first or not second:
+        return []
+
+    count = max(len(first), len(second))
+    return [
+        (first[i % len(first)], second[i % len(second)])
+        for i in range(count)
+    ]
+
+
+def sampled_matrix(
+    data: Sequence[Dict[str, Any]],
+    browsers: Sequence[Dict[str, Any]]
+) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Sample browser profiles × data rows down to a covering subset.
+
+    Every browser profile and every data row appears at least once.
+    Intended for parametrizing "browser_profile,<data arg>" directly.
+
+    Args:
+        data: Test data rows (e.g. from load_test_data)
+        browsers: Browser profiles (e.g. from ConfigLoader.get_browser_matrix)
+
+    Returns:
+        List of (browser_profile, data_row) tuples
+    """
+    return covering_pairs(browsers, data)